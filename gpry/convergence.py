@@ -346,16 +346,13 @@ class GaussianKL(ConvergenceCriterion):
         mean, cov = None, None
         attr_error, num_error = None, None
         if mpi.is_main_process:
+            # Computed once per sample by the acquisition, and shared by all criteria
             try:
-                X, _, _, w = acquisition.last_MC_sample(warn_reweight=False)
+                mean, cov = acquisition.last_MC_sample_mean_cov()
             except AttributeError as excpt:
                 attr_error = excpt
-            else:
-                try:
-                    mean = np.average(X, weights=w, axis=0)
-                    cov = np.atleast_2d(np.cov(X.T, aweights=w, ddof=0))
-                except (ValueError, TypeError) as excpt:
-                    num_error = excpt
+            except (ValueError, TypeError) as excpt:
+                num_error = excpt
         attr_error = mpi.bcast(attr_error)
         if attr_error:
             raise AttributeError from attr_error  # all processes!
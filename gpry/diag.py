@@ -26,21 +26,25 @@ do_plot_slices = True
 def diagnosis(runner):
     if not mpi.is_main_process:
         return
+    # Parameter names are cached by the Truth: retrieve them once for all checks/plots
+    params = list(runner.params)
     if do_check_inf_classifier and runner.gpr.infinities_classifier:
         print("**************************************************")
         print("Traning set (full):")
-        points = pd.DataFrame(
-            {f"x_{i + 1}": X for i, X in enumerate(runner.gpr.X_train_all.T)}
-        )
-        points = pd.DataFrame(dict(zip(
-            runner.model.parameterization.sampled_params(), runner.gpr.X_train_all.T
-        )))
+        points = pd.DataFrame(dict(zip(params, runner.gpr.X_train_all.T)))
         points["y_GP"] = runner.gpr.y_train_all
-        points["GP"] = [point in runner.gpr.X_train for point in runner.gpr.X_train_all]
+        # Row-wise membership of the full training set in the GP one (hashed, O(N))
+        X_train_rows = {x.tobytes() for x in runner.gpr.X_train}
+        is_in_GP = np.fromiter(
+            (x.tobytes() in X_train_rows for x in runner.gpr.X_train_all),
+            dtype=bool, count=len(runner.gpr.X_train_all),
+        )
+        points["GP"] = is_in_GP
         y_finite = runner.gpr.infinities_classifier.y_finite
         print(points)
         print(
-            f"TRAINING POINTS: {len(points)} TOTAL of which {sum(points['GP'])} FINITE"
+            f"TRAINING POINTS: {len(points)} TOTAL "
+            f"of which {np.count_nonzero(is_in_GP)} FINITE"
         )
         # TESTS and other data
         with warnings.catch_warnings():
@@ -79,11 +83,11 @@ def diagnosis(runner):
                 )
             print("    SUBTEST: threshold consistent:", consistent_threshold)
         all_finite_from_full_in_GP = all(
-            [point in runner.gpr.X_train
-             for point in runner.gpr.X_train_all[runner.gpr.is_finite()]
-             ]
+            is_in_GP[runner.gpr.is_finite(runner.gpr.y_train_all)]
+        )
+        same_length_finite_and_GP = (
+            np.count_nonzero(is_in_GP) == len(runner.gpr.y_train)
         )
-        same_length_finite_and_GP = sum(points["GP"]) == len(runner.gpr.y_train)
         is_train_consistent = all_finite_from_full_in_GP & same_length_finite_and_GP
         print("TEST: are the full and GP training sets consistent?", is_train_consistent)
         if not is_train_consistent:
@@ -114,7 +118,7 @@ def diagnosis(runner):
     ):
         try:
             plot_trace(
-                runner.model, runner.gpr, runner.convergence,
+                runner.truth, runner.gpr, runner.convergence,
                 runner.progress,
                 reference=reference)
         except ValueError as e:
@@ -129,25 +133,23 @@ def diagnosis(runner):
     # Plot mean GP and acq func slices
     if do_plot_slices:
         plot_slices(
-            runner.model, runner.gpr, runner.acquisition, reference=reference
+            runner.truth, runner.gpr, runner.acquisition, reference=reference
         )
         plt.savefig(os.path.join(
             runner.plots_path,
             f"slices_iteration_{runner.current_iteration:03d}.png")
         )
         plt.close()
-        try:
+        if fiducial is not None or reference is not None:
             plot_slices_reference(
-                runner.model, runner.gpr, fiducial, truth=True, reference=reference,
+                runner.truth, runner.gpr, fiducial, plot_truth=True,
+                reference=reference,
             )
             plt.savefig(os.path.join(
                 runner.plots_path,
                 f"comparison_slices_iteration_{runner.current_iteration:03d}.png")
             )
-        except:
-            raise
-            pass
-        plt.close()
+            plt.close()
 
     # Plot current MC sample (if available)
     from gpry.gp_acquisition import NORA
@@ -158,9 +160,11 @@ def diagnosis(runner):
         from getdist import plots
         from getdist.mcsamples import MCSamplesError
         from getdist.densities import DensitiesError
-        mcsamples = runner.acquisition.last_MC_sample_getdist(runner.model)
+        mcsamples = runner.acquisition.last_MC_sample_getdist(
+            list(zip(params, runner.labels))
+        )
         to_plot = [mcsamples]
-        to_plot_params = list(runner.model.parameterization.sampled_params())
+        to_plot_params = list(params)
         name_logp, label_logp = "logpost", r"\log(p)"
         if mcsamples.loglikes is not None:
             to_plot_params += [name_logp]
@@ -193,7 +197,7 @@ def diagnosis(runner):
                 to_plot, to_plot_params, filled=filled, legend_labels=legend_labels
             )
             try:
-                getdist_add_training(g, runner.model, runner.gpr, highlight_last=True)
+                getdist_add_training(g, params, runner.gpr, highlight_last=True)
             except Exception as e:
                 raise
                 print(f"FAILED ADDING TRAINING POINTS! Error msg: {e}")
@@ -204,7 +208,7 @@ def diagnosis(runner):
             plt.close()
         except (ValueError, IndexError, AttributeError, np.linalg.LinAlgError, MCSamplesError, DensitiesError) as e:
             print(f"COULD NOT DO TRIANGLE PLOT! Reason: {e}")
-        if runner.model.prior.d() == 2:
+        if runner.d == 2:
             try:
                 _plot_2d_model_acquisition_std(
                     runner.gpr, runner.acquisition, last_points=None, res=200
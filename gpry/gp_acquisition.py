@@ -9,7 +9,7 @@ import warnings
 import inspect
 import tempfile
 from time import time
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Mapping
 from functools import partial
 import numpy as np
@@ -341,11 +341,10 @@ class BatchOptimizer(GenericGPAcquisition):
 
         if i == 0:
             # Perform first run from last (in-bounds) training point.
-            # Cannot raise StopIteration if trust_region contains at least one point!
-            x0 = next(
-                X for X in gpr.X_train[::-1]
-                if np.all(is_in_bounds(X, bounds, check_shape=False))
-            )
+            # Cannot raise IndexError if trust_region contains at least one point!
+            i_in_bounds = np.flatnonzero(
+                is_in_bounds(gpr.X_train, bounds, check_shape=False))
+            x0 = gpr.X_train[i_in_bounds[-1]]
             if self.preprocessing_X is not None:
                 x0 = self.preprocessing_X.transform(x0)
             return self._constrained_optimization(self.obj_func, x0, transformed_bounds)
@@ -442,8 +441,10 @@ class BatchOptimizer(GenericGPAcquisition):
             acq_vals = np.empty(n_points)
             # Copy the GP instance as it is modified during
             # the optimization. The GP will be reset after the
-            # Acquisition is done.
-            gpr_ = deepcopy(gpr)
+            # Acquisition is done. A light copy suffices, since appending data without
+            # refitting re-assigns the training and model arrays instead of modifying
+            # them in place.
+            gpr_ = copy(gpr)
         gpr_ = mpi.bcast(gpr_ if mpi.is_main_process else None)
         n_acq_per_process = \
             mpi.split_number_for_parallel_processes(self.n_restarts_optimizer)
@@ -637,6 +638,8 @@ class NORA(GenericGPAcquisition):
         self._X_mc_reweight, self._y_mc_reweight = None, None
         self._sigma_y_mc_reweight, self._w_mc_reweight = None, None
         self.is_last_MC_reweighted = None
+        # Weighted mean and covmat of the last MC sample (computed when first requested)
+        self._mean_cov_mc = None
         self.pool = None
         self._acq_mc = None
 
@@ -874,6 +877,7 @@ class NORA(GenericGPAcquisition):
         """
         self.is_last_MC_reweighted = False
         self._X_mc, self._y_mc, self._sigma_y_mc, self._w_mc = X, y, sigma_y, w
+        self._mean_cov_mc = None
         if ensure_y_sigma_y:
             self._y_mc, self._sigma_y_mc = mpi.compute_y_parallel(
                 gpr, self._X_mc, self._y_mc, self._sigma_y_mc, ensure_sigma_y=True
@@ -882,6 +886,7 @@ class NORA(GenericGPAcquisition):
     def _reweight_last_MC_sample(self, gpr, bounds=None, ensure_sigma_y=False):
         """Stores the MC sample as attributes. Use ``last_MC_sample`` to retrieve it."""
         self.is_last_MC_reweighted = True
+        self._mean_cov_mc = None
         X_excpt, y_excpt = None, None
         if mpi.is_main_process and self._X_mc is None:
             X_excpt = ValueError("No samples yet!")
@@ -950,15 +955,39 @@ class NORA(GenericGPAcquisition):
             )
         return return_values
 
+    def last_MC_sample_mean_cov(self, copy=True):
+        """
+        Returns the weighted mean and covariance matrix of the last MC sample (the
+        reweighted one, if it was reweighted) as ``(mean, cov)``.
+
+        They are computed once per sample and cached. If ``copy=False``, the cached
+        arrays are returned, and should not be modified.
+
+        Raises ``ValueError`` or ``TypeError`` if they cannot be computed (e.g. if there
+        is no sample yet).
+        """
+        # getattr: NORA instances pickled before this cache was introduced lack it
+        if getattr(self, "_mean_cov_mc", None) is None:
+            X, _, _, w = self.last_MC_sample(copy=False, warn_reweight=False)
+            mean = np.average(X, weights=w, axis=0)
+            cov = np.atleast_2d(np.cov(X.T, aweights=w, ddof=0))
+            self._mean_cov_mc = (mean, cov)
+        mean, cov = self._mean_cov_mc
+        if copy:
+            return np.copy(mean), np.copy(cov)
+        return mean, cov
+
     @property
     def mean(self):
-        Xs, _, _, ws = self.last_MC_sample(copy=False, warn_reweight=False)
-        return np.average(Xs.T, weights=ws, axis=-1)
+        if self._X_mc is None:
+            return None
+        return self.last_MC_sample_mean_cov()[0]
 
     @property
     def cov(self):
-        Xs, _, _, ws = self.last_MC_sample(copy=False, warn_reweight=False)
-        return np.cov(Xs.T, aweights=ws, ddof=0)
+        if self._X_mc is None:
+            return None
+        return self.last_MC_sample_mean_cov()[1]
 
     def last_MC_sample_getdist(self, params, warn_reweight=True):
         """
@@ -1534,7 +1563,8 @@ class RankedPool():
         """
         # This function accounts for ~50% of the ranking time in add_one() (the rest is
         # mostly predict_std()).
-        # Taking dim=8 as reference, deepcopy is ~1/3 and append_to_data ~2/3 of the cost.
+        # Taking dim=8 as reference, a deepcopy was ~1/3 and append_to_data ~2/3 of the
+        # cost (now a light copy is used instead).
         # Possible optimization strategies:
         # - Disable SVM in cached models (no need to copy, fit, or evaluate), assuming all
         #   passed points are finite [tested to improve <10% overall in add_one{}]
@@ -1552,7 +1582,8 @@ class RankedPool():
         if i < 0:
             return self._gpr
         self.log(level=4, msg=f"[pool.cache] Caching model [{i + 1}]")
-        self.gpr_cond[i] = deepcopy(self._gpr)
+        # Light copy: arrays are re-assigned, not modified, when appending w/o refit.
+        self.gpr_cond[i] = copy(self._gpr)
         self.gpr_cond[i].append_to_data(
             self.X[:i + 1], self.y[:i + 1], fit_gpr=False, fit_classifier=False
         )
@@ -1,6 +1,6 @@
 # Builtin
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
 from operator import itemgetter
 from typing import Mapping
 from numbers import Number
@@ -41,7 +41,8 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
          by refitting the hyperparameters (theta) or alternatively by using the
          Matrix inversion Lemma to keep the hyperparameters fixed.
        * overwrites the (hidden) native deepcopy function. This enables copying
-         the GPR as well as the sampled points it contains.
+         the GPR as well as the sampled points it contains. A shallow ``copy``
+         shares the sampled points, but not the fitted state.
 
     Parameters
     ----------
@@ -262,6 +263,12 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
         predict
     """
 
+    # Large numerical arrays, broadcast as raw buffers when sharing the GPR with MPI
+    _mpi_buffer_attrs = (
+        "X_train_all", "y_train_all", "X_train_all_", "y_train_all_",
+        "X_train", "y_train", "X_train_", "y_train_", "L_", "V_", "alpha_",
+    )
+
     def __init__(self, kernel="RBF", output_scale_prior=[1e-2, 1e3],
                  length_scale_prior=[1e-3, 1e1], noise_level=1e-2, clip_factor=1.1,
                  optimizer="fmin_l_bfgs_b", n_restarts_optimizer=0,
@@ -734,7 +741,7 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
             # Even if assert test fails, use the real classification
             is_finite_last_appended = is_finite_all[-self.n_last_appended:]
         # The number of newly added points. Used for the _update_model method
-        self.n_last_appended_finite = sum(is_finite_last_appended)
+        self.n_last_appended_finite = np.count_nonzero(is_finite_last_appended)
         # If all added values are infinite there's no need to refit the GPR,
         # unless an explicit call for that with X, y = None was made
         if not self.n_last_appended_finite and not force_fit_gpr:
@@ -742,8 +749,9 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
         # 3. Re-fit the GPR in the transformed space, and maybe hyperparameters
         self.X_train = X_finite
         self.y_train = y_finite
-        self.X_train_ = self.preprocessing_X.transform(self.X_train)
-        self.y_train_ = self.preprocessing_y.transform(self.y_train)
+        # Reuse the already-transformed full training set (preprocessing is row-wise)
+        self.X_train_ = self.X_train_all_[is_finite_all]
+        self.y_train_ = self.y_train_all_[is_finite_all]
         self.alpha = self.noise_level_[is_finite_all]**2  # NB: different from self.alpha_
         self.newly_appended_for_inv = self.n_last_appended_finite
         if fit_gpr:
@@ -1145,7 +1153,10 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
             y_std_full = np.zeros(n_samples)  # std is zero when mu is -inf
             grad_mean_full = np.ones((n_samples, n_dims))
             grad_std_full = np.zeros((n_samples, n_dims))
-            X_ = X if self.preprocessing_X is None else self.preprocessing_X.transform(X)
+            X_ = (
+                X if self.preprocessing_X is None
+                else self.preprocessing_X.transform(X)
+            )
             finite = self.infinities_classifier.predict(
                 np.ascontiguousarray(X_), validate=validate
             )
@@ -1172,8 +1183,12 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
             y_mean_full[~finite] = self.minus_inf_value  # Set infinite values
             grad_mean_full[~finite] = self.inf_value  # the grad of inf values is +inf
             X = X[finite]  # only predict the finite samples
-
-        X_ = X if self.preprocessing_X is None else self.preprocessing_X.transform(X)
+            X_ = X_[finite]  # already transformed: no need to do it twice
+        else:
+            X_ = (
+                X if self.preprocessing_X is None
+                else self.preprocessing_X.transform(X)
+            )
 
         # Predict based on GP posterior
         K_trans = self.kernel_(X_, self.X_train_)
@@ -1247,10 +1262,9 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
             if return_std_grad:
                 grad_std = np.zeros(X_.shape[1])
                 if not np.allclose(y_std, grad_std):
-                    # TODO: This can be made much more efficient,
-                    #       but I don't think it's used currently
-                    grad_std = -np.dot(K_trans,
-                                       np.dot(self.V_.T.dot(self.V_), grad))[0] \
+                    # K_trans K^-1 grad = (V K_trans^T)^T (V grad), with V = L^-1,
+                    # reusing M from the std computation (K^-1 is never formed)
+                    grad_std = -np.dot(M.T, tri_mul(1., self.V_, grad, lower=True))[0] \
                         / y_std_untransformed
                     # Undo normalization
                     if self.preprocessing_y is not None:
@@ -1312,7 +1326,10 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
             # Initialize the full arrays for filling them later with infinite
             # and non-infinite values
             y_std_full = np.zeros(n_samples)  # std is zero when mu is -inf
-            X_ = X if self.preprocessing_X is None else self.preprocessing_X.transform(X)
+            X_ = (
+                X if self.preprocessing_X is None
+                else self.preprocessing_X.transform(X)
+            )
             finite = self.infinities_classifier.predict(
                 np.ascontiguousarray(X_), validate=validate
             )
@@ -1321,8 +1338,12 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
             if np.all(~finite):
                 return np.zeros(n_samples)
             X = X[finite]  # only predict the finite samples
-
-        X_ = X if self.preprocessing_X is None else self.preprocessing_X.transform(X)
+            X_ = X_[finite]  # already transformed: no need to do it twice
+        else:
+            X_ = (
+                X if self.preprocessing_X is None
+                else self.preprocessing_X.transform(X)
+            )
 
         # Predict based on GP posterior
         K_trans = self.kernel_(X_, self.X_train_)
@@ -1432,6 +1453,45 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor, BE):
             c._fitted = self._fitted
         return c
 
+    def __copy__(self):
+        """
+        Light-weight copy of the GPR, e.g. to keep a reference to its state before
+        refitting.
+
+        Shared with the original:
+
+        - Training and model arrays, since they are always re-assigned (never modified
+          in place) when appending data or refitting. Since data is only ever appended,
+          the training set of the copy is a prefix of that of the original after
+          further additions.
+        - The arrays of the infinities classifier, which re-assigns them all when
+          refitted (the classifier itself is a shallow copy).
+        - Other attributes not listed below (e.g. bounds, settings), which should not be
+          modified in place.
+
+        Copied, since they are modified in place:
+
+        - The fitted kernel and the preprocessors (when refitting).
+        - The random states of the GPR and of the infinities classifier, so that drawing
+          from the copy (e.g. optimizer restarts) does not advance the original's.
+        """
+        c = self.__class__.__new__(self.__class__)
+        c.__dict__.update(self.__dict__)
+        for attr in ["kernel_", "preprocessing_X", "preprocessing_y"]:
+            if getattr(self, attr, None) is not None:
+                setattr(c, attr, deepcopy(getattr(self, attr)))
+        # Common memo: keeps ``_rng`` the same object as ``random_state`` if it was
+        memo = {}
+        c.random_state = deepcopy(self.random_state, memo)
+        if "_rng" in self.__dict__:
+            c._rng = deepcopy(self._rng, memo)
+        if self.infinities_classifier is not None:
+            c.infinities_classifier = copy(self.infinities_classifier)
+            c.infinities_classifier.random_state = deepcopy(
+                self.infinities_classifier.random_state, memo
+            )
+        return c
+
     def _constrained_optimization(self, obj_func, initial_theta, bounds):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
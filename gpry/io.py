@@ -3,6 +3,7 @@ Module containing i/o utilities.
 """
 
 import os
+from io import BytesIO
 
 import dill as pickle
 
@@ -107,6 +108,27 @@ def read_checkpoint(path, truth=None):
     return truth, gpr, acquisition, convergence, options, progress
 
 
+def _dump_atomic(obj, filename):
+    """
+    Pickles ``obj`` into ``filename``.
+
+    The object is serialized in memory first and written with a single call to a
+    temporary file, which then replaces ``filename``, so that an interrupted write never
+    leaves a truncated checkpoint file behind.
+    """
+    buffer = BytesIO()
+    pickle.dump(obj, buffer, pickle.HIGHEST_PROTOCOL)
+    tmp_filename = filename + ".tmp"
+    try:
+        with open(tmp_filename, "wb") as f:
+            f.write(buffer.getbuffer())
+        os.replace(tmp_filename, filename)
+    finally:
+        # Only left behind if the write or the replacement failed
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+
 def save_checkpoint(path, truth, gpr, acquisition, convergence, options, progress):
     """
     This function is used to save all relevant parts of the GP loop for reuse
@@ -137,18 +159,13 @@ def save_checkpoint(path, truth, gpr, acquisition, convergence, options, progres
     create_path(path, verbose=False)
     try:
         if truth is not None:
-            with open(os.path.join(path, _checkpoint_filenames["truth"]), "wb") as f:
-                pickle.dump(truth.as_dict(), f, pickle.HIGHEST_PROTOCOL)
-        with open(os.path.join(path, _checkpoint_filenames["gpr"]), "wb") as f:
-            pickle.dump(gpr, f, pickle.HIGHEST_PROTOCOL)
-        with open(os.path.join(path, _checkpoint_filenames["acquisition"]), "wb") as f:
-            pickle.dump(acquisition, f, pickle.HIGHEST_PROTOCOL)
-        with open(os.path.join(path, _checkpoint_filenames["convergence"]), "wb") as f:
-            pickle.dump(convergence, f, pickle.HIGHEST_PROTOCOL)
-        with open(os.path.join(path, _checkpoint_filenames["options"]), "wb") as f:
-            pickle.dump(options, f, pickle.HIGHEST_PROTOCOL)
-        with open(os.path.join(path, _checkpoint_filenames["progress"]), "wb") as f:
-            pickle.dump(progress, f, pickle.HIGHEST_PROTOCOL)
+            _dump_atomic(
+                truth.as_dict(), os.path.join(path, _checkpoint_filenames["truth"])
+            )
+        for name, obj in [("gpr", gpr), ("acquisition", acquisition),
+                          ("convergence", convergence), ("options", options),
+                          ("progress", progress)]:
+            _dump_atomic(obj, os.path.join(path, _checkpoint_filenames[name]))
     except Exception as excpt:
         raise RuntimeError(
             "Could not save the checkpoint. Check if the path "
@@ -23,6 +23,45 @@ from collections import namedtuple
 # Copyright (c) 2016-2020 The scikit-optimize developers.
 # This module contains (heavily modified) code of the scikit-optimize package.
 
+# Entries of the expanded squared distance smaller than this fraction of the squared
+# norms of the (centred) points are recomputed from the differences, since the
+# cancellation in the expansion leaves them with too few significant digits.
+_sqeuclidean_recompute_rtol = 1e-2
+
+
+def _scaled_sqeuclidean(X, Y, length_scale):
+    """
+    Squared euclidean distances between the rows of X and Y, both rescaled by the
+    (possibly anisotropic) length scale.
+
+    Uses the expansion |x-y|^2 = |x|^2 + |y|^2 - 2 x.y, so that the bulk of the work
+    is a single matrix product (BLAS GEMM) instead of an (n, m, d) difference array.
+
+    The points are centred on the mean of Y first, to reduce cancellation for inputs
+    far from the origin, and the pairs of nearby points (the ones where the round-off
+    of the expansion is largest relative to the distance) are recomputed exactly.
+    """
+    Y = np.asarray(Y, dtype=float)
+    shift = Y.mean(axis=0)
+    X = (np.asarray(X, dtype=float) - shift) / length_scale
+    Y = (Y - shift) / length_scale
+    X_sqnorm = np.einsum("ij,ij->i", X, X)
+    Y_sqnorm = np.einsum("ij,ij->i", Y, Y)
+    dists = X @ Y.T
+    dists *= -2
+    dists += X_sqnorm[:, np.newaxis]
+    dists += Y_sqnorm[np.newaxis, :]
+    # Bounding |y|^2 by its maximum gives a (slightly larger) superset of the pairs to
+    # recompute, but saves an (n, m) array of norms.
+    threshold = _sqeuclidean_recompute_rtol * (X_sqnorm + np.max(Y_sqnorm))
+    recompute = np.flatnonzero(dists < threshold[:, np.newaxis])
+    if len(recompute):
+        i, j = np.divmod(recompute, dists.shape[1])
+        diff = X[i] - Y[j]
+        dists.flat[recompute] = np.einsum("ij,ij->i", diff, diff)
+    return dists
+
+
 class Hyperparameter(namedtuple('Hyperparameter',
                                 ('name', 'value_type', 'bounds',
                                  'max_length',
@@ -254,6 +293,15 @@ class RBF(Kernel, sk_RBF):
             "length_scale", "numeric", self.length_scale_bounds,
             self.max_length)
 
+    def __call__(self, X, Y=None, eval_gradient=False):
+        # Fast path for cross-covariances (e.g. K(X, X_train) at prediction time).
+        if Y is None or eval_gradient:
+            return super().__call__(X, Y, eval_gradient=eval_gradient)
+        length_scale = np.squeeze(self.length_scale).astype(float)
+        dists = _scaled_sqeuclidean(np.atleast_2d(X), Y, length_scale)
+        dists *= -0.5
+        return np.exp(dists, out=dists)
+
     def gradient_x(self, x, X_train):
         # diff = (x - X) / length_scale
         # size = (n_train_samples, n_dimensions)
@@ -323,6 +371,21 @@ class Matern(Kernel, sk_Matern):
             "length_scale", "numeric", self.length_scale_bounds,
             self.max_length)
 
+    def __call__(self, X, Y=None, eval_gradient=False):
+        # Fast path for cross-covariances (e.g. K(X, X_train) at prediction time).
+        if Y is None or eval_gradient or self.nu not in (0.5, 1.5, 2.5):
+            return super().__call__(X, Y, eval_gradient=eval_gradient)
+        length_scale = np.squeeze(self.length_scale).astype(float)
+        dists = np.sqrt(_scaled_sqeuclidean(np.atleast_2d(X), Y, length_scale))
+        if self.nu == 0.5:
+            return np.exp(-dists)
+        if self.nu == 1.5:
+            K = dists * sqrt(3)
+            return (1.0 + K) * np.exp(-K)
+        # nu == 2.5
+        K = dists * sqrt(5)
+        return (1.0 + K + K**2 / 3.0) * np.exp(-K)
+
     def gradient_x(self, x, X_train):
         x = np.asarray(x)
         X_train = np.asarray(X_train)
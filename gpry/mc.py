@@ -135,11 +135,12 @@ def mcmc_info_from_run(model, gpr, cov=None, cov_params=None, verbose=3):
         a dict with the ``sampler`` block for Cobaya's run function.
     """
     # Set the reference point of the prior to the sampled location with maximum
-    # posterior value
-    try:
-        i_max_location = np.argsort(gpr.y_train)[-mpi.RANK - 1]
+    # posterior value (the (RANK+1)-th highest one, found without a full sort)
+    k = mpi.RANK + 1
+    if k <= len(gpr.y_train):
+        i_max_location = np.argpartition(gpr.y_train, -k)[-k]
         max_location = gpr.X_train[i_max_location]
-    except IndexError:  # more MPI processes than training points: sample from prior
+    else:  # more MPI processes than training points: sample from prior
         max_location = [None] * gpr.X_train.shape[-1]
     model.prior.set_reference(dict(zip(model.prior.params, max_location)))
     # Create sampler info
@@ -291,14 +292,6 @@ def mc_sample_from_gp_cobaya(
             cov_params=covariance_params,
             verbose=verbose,
         )
-        # "ref" from available info (not used at the moment)
-        # best_point_per_mpi_rank = \
-        #     gpr.X_train[np.argsort(gpr.y_train)[-1 + mpi.RANK]]
-        # ref = {
-        #     p: val for p, val in zip(
-        #         paramnames, best_point_per_mpi_rank
-        #     )
-        # }
     elif sampler.lower() == "polychord":
         if output is False:
             warnings.warn(
@@ -445,8 +438,11 @@ def process_gdsamples(gdsamples_dict):
             return_dict[k] = v
         else:
             if check_cobaya_installed():
+                # pylint: disable=import-outside-toplevel
+                from cobaya.collection import SampleCollection
                 if isinstance(v, SampleCollection):
                     return_dict[k] = v.to_getdist(label=k)
+                    continue
             raise ValueError(
                 f"I don't know how to transform object of type {type(v)} "
                 "into getdist.MCSamples."
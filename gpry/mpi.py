@@ -68,6 +68,27 @@ def gather(args, root=0):
     return [args]
 
 
+def gather_array(arr, root=0):
+    """
+    Gathers into the process of rank ``root`` the arrays of all processes, concatenated
+    along the first axis in rank order (``None`` for the rest of the processes).
+
+    The arrays must have the same dtype and trailing dimensions, but may have different
+    lengths. They are sent as raw buffers with ``Gatherv``, instead of being pickled.
+    """
+    arr = np.ascontiguousarray(arr)
+    if not multiple_processes:
+        return arr
+    lengths = comm.gather(len(arr), root=root)
+    gathered, recvbuf = None, None
+    if RANK == root:
+        gathered = np.empty((sum(lengths),) + arr.shape[1:], dtype=arr.dtype)
+        counts = np.array(lengths, dtype=int) * int(np.prod(arr.shape[1:], dtype=int))
+        recvbuf = [gathered, counts]
+    comm.Gatherv(arr, recvbuf, root=root)
+    return gathered
+
+
 def allgather(args):
     """
     Wrapper for MPI.allgather, that works if MPI not present.
@@ -77,6 +98,21 @@ def allgather(args):
     return [args]
 
 
+def allreduce_maxloc(value):
+    """
+    Returns the maximum of ``value`` over all processes and the rank of the process
+    holding it (the lowest one in case of ties), using a single typed ``Allreduce``.
+    """
+    if not multiple_processes:
+        return value, RANK
+    # Aligned, to match the C struct {double; int} of MPI.DOUBLE_INT
+    buffer = np.array(
+        [(value, RANK)], dtype=np.dtype([("value", "f8"), ("rank", "i4")], align=True)
+    )
+    comm.Allreduce(MPI.IN_PLACE, [buffer, MPI.DOUBLE_INT], op=MPI.MAXLOC)
+    return float(buffer["value"][0]), int(buffer["rank"][0])
+
+
 def split_number_for_parallel_processes(n, n_proc=SIZE):
     """
     Splits a number of atomic tasks `n` between the parallel processes.
@@ -179,6 +215,45 @@ def share_attr(instance, attr_name, root=0):
     )
 
 
+def bcast_with_arrays(obj, array_attrs, root=0):
+    """
+    Broadcasts ``obj`` from process of rank ``root``, sending the numerical array
+    attributes listed in ``array_attrs`` as raw contiguous buffers (``Bcast``) instead
+    of pickling them together with the rest of the object.
+
+    Meant for objects holding large arrays (e.g. the GPR, with its training set and
+    Cholesky factors), for which pickling dominates the cost of the broadcast.
+
+    Returns the broadcasted object (``obj`` itself for the ``root`` process).
+    """
+    if not multiple_processes:
+        return obj
+    arrays = {}
+    if RANK == root:
+        for attr in array_attrs:
+            value = getattr(obj, attr, None)
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                arrays[attr] = np.ascontiguousarray(value)
+        # Detach the arrays while the rest of the object is pickled
+        for attr in arrays:
+            setattr(obj, attr, None)
+    try:
+        specs = {attr: (arr.shape, arr.dtype.str) for attr, arr in arrays.items()}
+        received, specs = comm.bcast(
+            (obj, specs) if RANK == root else None, root=root
+        )
+    finally:
+        for attr, arr in arrays.items():
+            setattr(obj, attr, arr)
+    if RANK == root:
+        received = obj
+    for attr, (shape, dtype) in specs.items():
+        buffer = arrays[attr] if RANK == root else np.empty(shape, dtype=dtype)
+        comm.Bcast(buffer, root=root)
+        setattr(received, attr, buffer)
+    return received
+
+
 def compute_y_parallel(gpr, X, y, sigma_y, ensure_sigma_y=False):
     """
     Computes the GPR mean (and std if `do_sigma_y=True`) in parallel.
@@ -28,6 +28,8 @@ from gpry.tools import (
 # Use latex labels when available
 plt.rcParams["text.usetex"] = True
 _plot_dist_fontsize = 7
+# Max number of points per GPR/acquisition evaluation for dense grids
+_eval_batch_size = 4096
 
 
 def simple_latex_sci_notation(string):
@@ -54,9 +56,7 @@ def param_samples_for_slices(X, i, bounds, n=200):
     """
     X = np.atleast_2d(X)
     Xs_i = np.linspace(bounds[0], bounds[1], n)
-    X_slices = np.empty(shape=(X.shape[0], n, X.shape[1]), dtype=float)
-    for j, X_j in enumerate(X):
-        X_slices[j, :, :] = n * [X_j]
+    X_slices = np.repeat(X[:, np.newaxis, :].astype(float), n, axis=1)
     X_slices[:, :, i] = Xs_i
     return X_slices
 
@@ -251,6 +251,8 @@ def plot_slices(truth, gpr, acquisition, X=None, reference=None):
 
     Lines are coloured according to the value of the mean GP at points X.
 
+    Returns the figure and axes ``(fig, axes)``.
+
     # TODO: make acq func optional
     """
     params = truth.params
@@ -271,22 +273,31 @@ def plot_slices(truth, gpr, acquisition, X=None, reference=None):
     min_y, max_y = min(y), max(y)
     norm_y = lambda y: (y - min_y) / (max_y - min_y)
     prior_bounds = truth.prior_bounds
-    Xs_for_plots = dict(
-        (p, param_samples_for_slices(X, i, prior_bounds[i], n=200))
-        for i, p in enumerate(params)
+    n_slice = 200
+    # All slices (params x points x n_slice), evaluated together (in batches)
+    Xs_for_plots = np.array([
+        param_samples_for_slices(X, i, prior_bounds[i], n=n_slice)
+        for i in range(len(params))
+    ])
+    Xs_flat = Xs_for_plots.reshape(-1, Xs_for_plots.shape[-1])
+    # TODO: could cut by half # of GP evals by reusing for acq func
+    ys_for_plots = _eval_in_batches(gpr.predict, Xs_flat).reshape(
+        Xs_for_plots.shape[:-1]
+    )
+    acqs_for_plots = _eval_in_batches(lambda X_: acquisition(X_, gpr), Xs_flat).reshape(
+        Xs_for_plots.shape[:-1]
     )
     if reference is not None:
         reference = _prepare_reference(reference, truth)
     cmap = matplotlib.colormaps["viridis"]
     for i, p in enumerate(params):
-        for j, Xs_j in enumerate(Xs_for_plots[p]):
+        for j, Xs_j in enumerate(Xs_for_plots[i]):
             cmap_norm = cmap(norm_y(y[j]))
             alpha = 1
-            # TODO: could cut by half # of GP evals by reusing for acq func
-            axes[0, i].plot(Xs_j[:, i], gpr.predict(Xs_j), c=cmap_norm, alpha=alpha)
+            axes[0, i].plot(Xs_j[:, i], ys_for_plots[i, j], c=cmap_norm, alpha=alpha)
             axes[0, i].scatter(X[j][i], y[j], color=cmap_norm, alpha=alpha)
             axes[0, i].set_ylabel(r"$\log(p)$")
-            acq_values = acquisition(Xs_j, gpr)
+            acq_values = acqs_for_plots[i, j]
             axes[1, i].plot(Xs_j[:, i], acq_values, c=cmap_norm, alpha=alpha)
             axes[1, i].set_ylabel(r"$\alpha(\mu,\sigma)$")
             label = truth.labels[i] if truth.labels is not None else p
@@ -304,6 +315,7 @@ def plot_slices(truth, gpr, acquisition, X=None, reference=None):
                         bounds[1], bounds[3], facecolor="tab:blue", alpha=0.2, zorder=-99
                     )
                 ax.axvline(bounds[2], c="tab:blue", alpha=0.3, ls="--")
+    return fig, axes
 
 
 def plot_slices_reference(truth, gpr, X, plot_truth=True, reference=None):
@@ -311,6 +323,8 @@ def plot_slices_reference(truth, gpr, X, plot_truth=True, reference=None):
     Plots slices of the gpr model and true log-posterior (if ``plot_truth=True``) along
     parameter coordinates for a given point ``X``, leaving all coordinates of that point
     fixed except for the one being sliced.
+
+    Returns the figure and axes ``(fig, axes)``.
     """
     params = truth.params
     fig, axes = plt.subplots(
@@ -407,6 +421,7 @@ def plot_slices_reference(truth, gpr, X, plot_truth=True, reference=None):
                     bounds[1], bounds[3], facecolor="tab:blue", alpha=0.2, zorder=-99
                 )
                 axes[i].axvline(bounds[2], c="tab:blue", alpha=0.3, ls="--")
+    return fig, axes
 
 
 def plot_corner_getdist(
@@ -549,7 +564,7 @@ def plot_corner_getdist(
             gdplot, training_params, training, highlight_last=training_highlight_last
         )
     if output is not None:
-        plt.savefig(output, dpi=output_dpi)
+        gdplot.fig.savefig(output, dpi=output_dpi)
     return gdplot
 
 
@@ -609,25 +624,19 @@ def getdist_add_training(
             bounds[j] = ax.get_ylim()
     # Now reduce the set of points to the ones within ranges
     # (needed to get good limits for the colorbar of the log-posterior)
-    Xs_finite = np.copy(gpr.X_train)
-    ys_finite = np.copy(gpr.y_train)
-    Xs_infinite = np.copy(gpr.X_train_infinite)
+    # (boolean masks on 2d arrays return 2d arrays, possibly empty: no reshaping needed)
+    Xs_finite, ys_finite = gpr.X_train, gpr.y_train
+    Xs_infinite = gpr.X_train_infinite
+    if highlight_last:
+        Xs_last = gpr.last_appended[0]
     for i, (mini, maxi) in enumerate(bounds):
-        i_within_finite = np.argwhere(
-            np.logical_or(mini < Xs_finite[:, i], Xs_finite[:, i] < maxi)
-        )
-        Xs_finite = np.atleast_2d(np.squeeze(Xs_finite[i_within_finite]))
-        ys_finite = np.atleast_1d(np.squeeze(ys_finite[i_within_finite]))
-        i_within_infinite = np.argwhere(
-            np.logical_or(mini < Xs_infinite[:, i], Xs_infinite[:, i] < maxi)
-        )
-        Xs_infinite = np.atleast_2d(np.squeeze(Xs_infinite[i_within_infinite]))
+        within_finite = (mini < Xs_finite[:, i]) & (Xs_finite[:, i] < maxi)
+        Xs_finite, ys_finite = Xs_finite[within_finite], ys_finite[within_finite]
+        Xs_infinite = Xs_infinite[
+            (mini < Xs_infinite[:, i]) & (Xs_infinite[:, i] < maxi)
+        ]
         if highlight_last:
-            Xs_last = gpr.last_appended[0]
-            i_within_last = np.argwhere(
-                np.logical_or(mini < Xs_last[:, i], Xs_last[:, i] < maxi)
-            )
-            Xs_last = np.atleast_2d(np.squeeze(Xs_last[i_within_last]))
+            Xs_last = Xs_last[(mini < Xs_last[:, i]) & (Xs_last[:, i] < maxi)]
     if len(Xs_finite) == 0 and len(Xs_infinite) == 0:  # no points within plotting ranges
         return getdist_plot
     # Create colormap with appropriate limits
@@ -636,19 +645,21 @@ def getdist_add_training(
         Ncolors = 256
         color_bounds = np.linspace(min(ys_finite), max(ys_finite), Ncolors)
         norm = matplotlib.colors.BoundaryNorm(color_bounds, Ncolors)
-    # Add points
+    # Add points (rasterized, to keep vector outputs small for large training sets)
     for (i, j), ax in ax_dict.items():
         # 1st -inf points, so the are displayed in the background of the finite ones.
         # and we give them low zorder anyway, so that they lay behind the contours
         if len(Xs_infinite) > 0:
             points_infinite = Xs_infinite[:, [i, j]]
             ax.scatter(
-                *points_infinite.T, marker=marker_inf, s=20, c="k", alpha=0.3, zorder=-99
+                *points_infinite.T, marker=marker_inf, s=20, c="k", alpha=0.3,
+                zorder=-99, rasterized=True,
             )
         if len(Xs_finite) > 0:
             points_finite = Xs_finite[:, [i, j]]
             ax.scatter(
-                *points_finite.T, marker=marker, c=norm(ys_finite), alpha=0.3, cmap=cmap
+                *points_finite.T, marker=marker, c=norm(ys_finite), alpha=0.3,
+                cmap=cmap, rasterized=True,
             )
         if highlight_last and len(Xs_last) > 0:
             points_last = Xs_last[:, [i, j]]
@@ -658,6 +669,7 @@ def getdist_add_training(
                 c=len(points_last) * [[0, 0, 0, 0]],
                 edgecolor="r",
                 lw=0.5,
+                rasterized=True,
             )
     # Colorbar
     if len(Xs_finite) > 0 and not np.isclose(min(ys_finite), max(ys_finite)):
@@ -827,6 +839,8 @@ def plot_trace(
 
     Can take a reference sample or reference bounds (dict with parameters as keys and 5
     sorted bounds as values, or alternatively just a central value).
+
+    Returns the figure and axes ``(fig, axes)``.
     """
     X = gpr.X_train_all
     y = gpr.y_train_all
@@ -907,7 +921,10 @@ def plot_trace(
     for i, p in enumerate(truth.params):
         label = truth.labels[i] if truth.labels else p
         ax = axes[i + 2]
-        if gpr.infinities_classifier is not None and sum(y_finite) < len(X):
+        if (
+                gpr.infinities_classifier is not None and
+                np.count_nonzero(y_finite) < len(X)
+        ):
             ax.scatter(
                 i_eval,
                 X[:, i],
@@ -953,10 +970,12 @@ def plot_trace(
         for n_iteration in progress.data["n_total"][1:]:
             ax.axvline(n_iteration + 0.5, ls="--", c="0.75", lw=0.75, zorder=-9)
     # TODO: make sure the x ticks are int
+    return fig, axes
 
 
 def plot_distance_distribution(
-    points, mean, covmat, density=False, show_added=True, ax=None
+    points, mean, covmat, density=False, show_added=True, ax=None,
+    radial_distances=None,
 ):
     """
     Plots a histogram of the distribution of points with respect to the number of standard
@@ -979,6 +998,10 @@ def plot_distance_distribution(
         added (bluer stacks represent newer points).
     ax: matplotlib axes
         If provided, they will be used for the plot.
+    radial_distances: array-like, ``(N_points)``, optional
+        Distances of the points in units of standard deviations, as returned by
+        :func:`gpry.tools.gaussian_distance`, if already computed (e.g. for a previous
+        call with a different ``density``).
 
     Returns
     -------
@@ -987,15 +1010,15 @@ def plot_distance_distribution(
     if isinstance(points, GaussianProcessRegressor):
         points = points.X_train
     dim = np.atleast_2d(points).shape[1]
-    radial_distances = gaussian_distance(points, mean, covmat)
+    if radial_distances is None:
+        radial_distances = gaussian_distance(points, mean, covmat)
     bins = list(range(0, int(np.ceil(np.max(radial_distances))) + 1))
     num_or_dens = "Density" if density else "Number"
     if density:
-        volumes = [
-            volume_sphere(bins[i], dim) - volume_sphere(bins[i - 1], dim)
-            for i in range(1, len(bins))
-        ]
-        weights = [1 / volumes[int(np.floor(r))] for r in radial_distances]
+        volumes = np.diff([volume_sphere(b, dim) for b in bins])
+        # The right-most edge is included in the last bin
+        i_bin = np.minimum(np.floor(radial_distances).astype(int), len(volumes) - 1)
+        weights = 1 / volumes[i_bin]
     else:
         weights = np.ones(len(radial_distances))
     if ax is None:
@@ -1006,7 +1029,7 @@ def plot_distance_distribution(
     if show_added:
         title_str += " (bluer=newer)"
         cmap = plt.get_cmap("Spectral")
-        colors = [cmap(i / len(points)) for i in range(len(points))]
+        colors = cmap(np.arange(len(radial_distances)) / len(radial_distances))
         ax.hist(
             np.atleast_2d(radial_distances),
             bins=bins,
@@ -1036,6 +1059,19 @@ def plot_distance_distribution(
     return (fig, ax)
 
 
+def _eval_in_batches(func, X, batch_size=_eval_batch_size):
+    """
+    Evaluates ``func`` on consecutive batches of rows of ``X`` and concatenates the
+    results (also if ``func`` returns a tuple of arrays).
+
+    Bounds the size of the intermediate kernel matrices for large sets of points.
+    """
+    results = [func(X[i:i + batch_size]) for i in range(0, len(X), batch_size)]
+    if isinstance(results[0], tuple):
+        return tuple(np.concatenate(r) for r in zip(*results))
+    return np.concatenate(results)
+
+
 def _plot_2d_model_acquisition(gpr, acquisition, last_points=None, res=200):
     """
     Contour plots for model prediction and acquisition function value of a 2d model.
@@ -1051,10 +1087,14 @@ def _plot_2d_model_acquisition(gpr, acquisition, last_points=None, res=200):
     x = np.linspace(bounds[0][0], bounds[0][1], res)
     y = np.linspace(bounds[1][0], bounds[1][1], res)
     X, Y = np.meshgrid(x, y)
-    xx = np.ascontiguousarray(np.vstack([X.reshape(X.size), Y.reshape(Y.size)]).T)
-    model_mean = gpr.predict(xx)
+    # Fill the (C-ordered) array of points column by column, without intermediate copies
+    xx = np.empty((X.size, 2))
+    xx[:, 0], xx[:, 1] = X.ravel(), Y.ravel()
+    model_mean = _eval_in_batches(gpr.predict, xx)
     # TODO: maybe change this one below if __call__ method added to GP_acquisition
-    acq_value = acquisition(xx, gpr, eval_gradient=False)
+    acq_value = _eval_in_batches(
+        lambda X_: acquisition(X_, gpr, eval_gradient=False), xx
+    )
     # maybe show the next max of acquisition
     acq_max = xx[np.argmax(acq_value)]
     fig, ax = plt.subplots(1, 2, figsize=(8, 4))
@@ -1110,10 +1150,14 @@ def _plot_2d_model_acquisition_finite(gpr, acquisition, last_points=None, res=20
     x = np.linspace(bounds[0][0], bounds[0][1], res)
     y = np.linspace(bounds[1][0], bounds[1][1], res)
     X, Y = np.meshgrid(x, y)
-    xx = np.ascontiguousarray(np.vstack([X.reshape(X.size), Y.reshape(Y.size)]).T)
-    model_mean = gpr.predict(xx)
+    # Fill the (C-ordered) array of points column by column, without intermediate copies
+    xx = np.empty((X.size, 2))
+    xx[:, 0], xx[:, 1] = X.ravel(), Y.ravel()
+    model_mean = _eval_in_batches(gpr.predict, xx)
     # TODO: maybe change this one below if __call__ method added to GP_acquisition
-    acq_value = acquisition(xx, gpr, eval_gradient=False)
+    acq_value = _eval_in_batches(
+        lambda X_: acquisition(X_, gpr, eval_gradient=False), xx
+    )
     # maybe show the next max of acquisition
     acq_max = xx[np.argmax(acq_value)]
     fig, ax = plt.subplots(1, 2, figsize=(8, 4))
@@ -1179,10 +1223,16 @@ def _plot_2d_model_acquisition_std(gpr, acquisition, last_points=None, res=200):
     x = np.linspace(bounds[0][0], bounds[0][1], res)
     y = np.linspace(bounds[1][0], bounds[1][1], res)
     X, Y = np.meshgrid(x, y)
-    xx = np.ascontiguousarray(np.vstack([X.reshape(X.size), Y.reshape(Y.size)]).T)
-    model_mean, model_std = gpr.predict(xx, return_std=True)
+    # Fill the (C-ordered) array of points column by column, without intermediate copies
+    xx = np.empty((X.size, 2))
+    xx[:, 0], xx[:, 1] = X.ravel(), Y.ravel()
+    model_mean, model_std = _eval_in_batches(
+        lambda X_: gpr.predict(X_, return_std=True), xx
+    )
     # TODO: maybe change this one below if __call__ method added to GP_acquisition
-    acq_value = acquisition(xx, gpr, eval_gradient=False)
+    acq_value = _eval_in_batches(
+        lambda X_: acquisition(X_, gpr, eval_gradient=False), xx
+    )
     # maybe show the next max of acquisition
     acq_max = xx[np.argmax(acq_value)]
     fig, ax = plt.subplots(1, 3, figsize=(12, 4))
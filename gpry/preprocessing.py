@@ -17,6 +17,7 @@ unnecessary ``copy`` statements.
 """
 
 import warnings
+from functools import cached_property
 from numbers import Number
 from itertools import product
 
@@ -349,12 +350,22 @@ class Normalize_bounds:
     def update_bounds(self, bounds):
         bounds = np.asarray(bounds)
         self.bounds = bounds
-        self.bounds_min = bounds[:, 0]
-        self.bounds_max = bounds[:, 1]
+        # Unit-stride copies of the columns
+        self.bounds_min = np.ascontiguousarray(bounds[:, 0])
+        self.bounds_max = np.ascontiguousarray(bounds[:, 1])
         if np.any(self.bounds_min > self.bounds_max):
             raise ValueError(
                 "The bounds must be in dimension-wise order " "min->max, got \n" + bounds
             )
+        # Recomputed from the new bounds when next needed
+        self.__dict__.pop("bounds_width", None)
+
+    @cached_property
+    def bounds_width(self):
+        """Width of the bounds along every dimension (computed once per bounds)."""
+        # Not stored by update_bounds, so that instances pickled before this attribute
+        # was introduced (e.g. old checkpoints) can compute it too.
+        return self.bounds_max - self.bounds_min
 
     def transform_bounds(self, bounds):
         transformed_bounds = np.ones_like(bounds)
@@ -377,7 +388,7 @@ class Normalize_bounds:
         X_transformed : array-like, shape = (n_samples, n_dims)
             Transformed X-values
         """
-        return (X - self.bounds_min) / (self.bounds_max - self.bounds_min)
+        return (X - self.bounds_min) / self.bounds_width
 
     def inverse_transform(self, X):
         """Applies the inverse transformation
@@ -392,7 +403,7 @@ class Normalize_bounds:
         X : array-like, shape = (n_samples, n_dims)
             Inverse transformed (original) values.
         """
-        return (X * (self.bounds_max - self.bounds_min)) + self.bounds_min
+        return (X * self.bounds_width) + self.bounds_min
 
     def inverse_transform_scale(self, X):
         """Applies the inverse transformation to an unbounded scale (e.g. the kernel
@@ -408,7 +419,7 @@ class Normalize_bounds:
         X : array-like, shape = (n_samples, n_dims)
             Inverse transformed (original) values.
         """
-        return X * (self.bounds_max - self.bounds_min)
+        return X * self.bounds_width
 
 
 class Pipeline_y:
@@ -233,10 +233,10 @@ class Progress:
         plt.ylabel("Time (s)" + multiprocess_str)
         plt.legend(loc="upper left")
         if save:
-            plt.savefig(save)
+            fig.savefig(save)
         if show:
             plt.show(block=True)
-        plt.close()
+        plt.close(fig)
 
 
 # pylint: disable=attribute-defined-outside-init
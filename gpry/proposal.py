@@ -5,7 +5,6 @@ optimize the acquisition function.
 """
 
 from abc import ABCMeta, abstractmethod
-from functools import partial
 from math import inf
 from warnings import warn
 
@@ -93,6 +92,24 @@ class InitialPointProposer(metaclass=ABCMeta):
     Base proposer class for all proposers which work for initial point generation.
     """
 
+    def get_many(self, n, rng=None):
+        """
+        Returns an array of ``n`` random samples, with shape ``(n, d)``.
+
+        By default calls ``get`` ``n`` times. Proposers that can draw all samples at
+        once should override it.
+
+        Parameters
+        ----------
+        n : int
+            Number of samples.
+
+        rng : int or numpy.random.Generator, optional
+            The generator used to propose points. If an integer is given, it is used as
+            a seed for the default global numpy random number generator.
+        """
+        return np.array([self.get(rng=rng) for _ in range(n)]).reshape((n, -1))
+
 
 class ReferenceProposer(Proposer, InitialPointProposer):
     """
@@ -147,17 +164,20 @@ class UniformProposer(Proposer, InitialPointProposer):
     def __init__(self, bounds):
         self.update_bounds(bounds)
 
+    # pylint: disable=attribute-defined-outside-init
     def update_bounds(self, bounds):
         super().update_bounds(bounds)
-        n_d = len(bounds)
-        proposal_pdf = scipy.stats.uniform(
-            loc=bounds[:, 0], scale=bounds[:, 1] - bounds[:, 0]
-        )
-        self.proposal_function = partial(proposal_pdf.rvs, size=n_d)
+        self._loc = self.bounds[:, 0]
+        self._scale = self.bounds[:, 1] - self.bounds[:, 0]
+        self._proposal_pdf = scipy.stats.uniform(loc=self._loc, scale=self._scale)
 
     # Within updated bounds by construction: no need to decorate it.
     def get(self, rng=None):
-        return self.proposal_function(random_state=rng)
+        return self._proposal_pdf.rvs(size=len(self._loc), random_state=rng)
+
+    def get_many(self, n, rng=None):
+        # Same stream of random numbers as n calls to ``get``
+        return self._proposal_pdf.rvs(size=(n, len(self._loc)), random_state=rng)
 
 
 class PartialProposer(Proposer, InitialPointProposer):
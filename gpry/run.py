@@ -5,11 +5,12 @@ and the processing of results.
 
 import os
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import wraps
 from typing import Mapping, Sequence
 from numbers import Number
 import numpy as np
-from tqdm import tqdm
+from scipy.spatial import cKDTree
 
 from gpry import mpi
 from gpry.truth import get_truth
@@ -25,13 +26,37 @@ import gpry.convergence as gpryconv
 from gpry.progress import Progress, Timer, TimerCounter
 from gpry.io import create_path, check_checkpoint, read_checkpoint, save_checkpoint
 from gpry import mc
-import gpry.plots as gpplt
 from gpry.tools import get_Xnumber, check_candidates, is_in_bounds, \
-    mean_covmat_from_evals, mean_covmat_from_samples, kl_norm
+    mean_covmat_from_evals, mean_covmat_from_samples, kl_norm, gaussian_distance
 
 _plots_path = "images"
 
 
+def plot_in_main_process(warn=True):
+    """
+    Decorator for plotting methods of the ``Runner``: makes them do nothing when called
+    from an MPI process other than the main one (warning about it if ``warn=True``), and
+    creates the plots folder if needed before calling them.
+    """
+
+    def decorator(plot_method):
+        @wraps(plot_method)
+        def wrapper(self, *args, **kwargs):
+            if not mpi.is_main_process:
+                if warn:
+                    warnings.warn(
+                        "Running plotting function from non-root MPI process. "
+                        "Doing nothing."
+                    )
+                return None
+            self.ensure_paths(plots=True)
+            return plot_method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class Runner():
     r"""
     Class that takes care of constructing the Bayesian quadrature/likelihood
@@ -120,6 +145,11 @@ class Runner():
               optimiser run from the last optimum hyperparameters. Overridden by
               ``fit_full_every`` where it matches its periodicity. Pass np.inf or a large
               number to never refit from last optimum (default : 1, i.e. every iteration).
+            * checkpoint_every : Number of iterations between checkpoint saves. The
+              checkpoint is always saved after the initial training and at the last
+              iteration, i.e. when the run converges, when the evaluation budget is
+              exhausted, or when the acquisition gives up after too many re-samples
+              (default : 1, i.e. every iteration).
 
     callback : callable, optional (default=None)
         Function run each iteration after adapting the recently acquired points and
@@ -277,6 +307,9 @@ class Runner():
         self.old_gpr, self.new_X, self.new_y, self.y_pred = None, None, None, None
         self.mean, self.cov = None, None
         # Placeholders for the final MC sample
+        self._last_mc_samples = None
+        # Cached GetDist conversion, built on demand, as (samples_dict, MCSamples)
+        self._last_mc_samples_getdist = None
         # Placeholders for fiducial quantities
         self.fiducial_X = None
         self.fiducial_logpost = None
@@ -494,28 +527,36 @@ class Runner():
             options.get(optname, default) if options.get(optname, default) is not None
             else default
         )
+        # Dimensionality-derived defaults, computed once
+        d = self.d
+        d_1p5 = d**1.5
         _get_opt = lambda optname, default: get_Xnumber(
-            _opt_or_default(optname, default), "d", self.d, dtype=int, varname=optname
+            _opt_or_default(optname, default), "d", d, dtype=int, varname=optname
         )
-        self.n_initial = max(_get_opt("n_initial", 3 * self.d), 2)  # at least 2 points!
-        self.max_initial = _get_opt("max_initial", 30 * self.d**1.5)
-        self.max_total = _get_opt("max_total", max(self.max_initial, 70 * self.d**1.5))
+        self.n_initial = max(_get_opt("n_initial", 3 * d), 2)  # at least 2 points!
+        self.max_initial = _get_opt("max_initial", 30 * d_1p5)
+        self.max_total = _get_opt("max_total", max(self.max_initial, 70 * d_1p5))
         self.max_finite = _get_opt("max_finite", self.max_total)
-        self.n_points_per_acq = _get_opt("n_points_per_acq", self.d)
-        self.fit_full_every = max(_get_opt("fit_full_every", 2 * np.sqrt(self.d)), 1)
+        self.n_points_per_acq = _get_opt("n_points_per_acq", d)
+        self.fit_full_every = max(_get_opt("fit_full_every", 2 * np.sqrt(d)), 1)
         self.fit_simple_every = max(_get_opt("fit_simple_every", 1), 1)
+        self.checkpoint_every = max(_get_opt("checkpoint_every", 1), 1)
         # TODO: undocumented option (under testing):
         self.n_resamples_before_giveup = _get_opt("n_resamples_before_giveup", 2)
         self.resamples = 0
         # Sanity checks/adjustments
-        for attr in ["n_initial", "max_initial", "max_finite",
-                     "max_total", "n_points_per_acq",
-                     "fit_full_every", "fit_simple_every",
-                     ]:
-            _large_value = 1000000000
-            setattr(self, attr, min(_large_value, int(np.round(getattr(self, attr)))))
-            if getattr(self, attr) <= 0:
+        attrs = ["n_initial", "max_initial", "max_finite",
+                 "max_total", "n_points_per_acq",
+                 "fit_full_every", "fit_simple_every", "checkpoint_every",
+                 ]
+        _large_value = 1000000000
+        values = np.minimum(
+            np.round([getattr(self, attr) for attr in attrs]), _large_value
+        ).astype(int)
+        for attr, value in zip(attrs, values):
+            if value <= 0:
                 raise ValueError(f"'{attr}' must be a positive integer.")
+            setattr(self, attr, int(value))
         if self.max_initial < self.n_initial:
             raise ValueError(
                 "The number of maximum initial evaluations "
@@ -540,11 +581,11 @@ class Runner():
                 "needs to be larger than or equal to the maximum number of finite ones "
                 f"'max_finite={self.max_finite}'."
             )
-        if self.n_points_per_acq > self.d:
+        if self.n_points_per_acq > d:
             self.log(
                 "Warning: The number kriging believer samples per acquisition step "
                 f"'n_points_per_acq={self.n_points_per_acq}' is larger than the number "
-                f"of dimensions 'd={self.d}' of the feature space. This may lead to slow "
+                f"of dimensions 'd={d}' of the feature space. This may lead to slow "
                 "convergence.",
                 level=2,
             )
@@ -589,16 +630,25 @@ class Runner():
         recovered by summing ``self.log_prior_volume`` to this function.
 
         Always returns an array.
+
+        For many points, call it once with all of them (the GPR prediction is
+        vectorized), not once per point.
         """
-        return self.gpr.predict(np.atleast_2d(X))
-    
+        if not (isinstance(X, np.ndarray) and X.ndim == 2):
+            X = np.atleast_2d(X)
+        return self.gpr.predict(X)
+
     def logL(self, X):
         """
         Wrapper for the surrogate likelihood. Call with a point or a list of them.
 
         Always returns an array.
         """
-        return self.gpr.predict(np.atleast_2d(X)) - self.truth.logprior(X)
+        X = np.atleast_2d(X)
+        # The GPR is evaluated once for all points; the (cheap) prior point by point.
+        logprior = np.fromiter(
+            (self.truth.logprior(x) for x in X), dtype=float, count=len(X))
+        return self.gpr.predict(X) - logprior
 
 
     def logp_truth(self, X):
@@ -617,9 +667,12 @@ class Runner():
         Simple wrapper to evaluate and return the true log-posterior at X, and log it
         with the given ``level``.
         """
-        self.log(f"[{mpi.RANK}] Evaluating true posterior at\n{X}", level=level)
+        # Check verbosity first, to avoid formatting arrays that would not be printed
+        if self._verbose(level):
+            self.log(f"[{mpi.RANK}] Evaluating true posterior at\n{X}", level=level)
         logp = self.logp_truth(X)
-        self.log(f"[{mpi.RANK}] --> log(p) = {logp}", level=4)
+        if self._verbose(4):
+            self.log(f"[{mpi.RANK}] --> log(p) = {logp}", level=4)
         return logp
 
     def logprior(self, X):
@@ -628,12 +681,19 @@ class Runner():
         """
         return self.truth.logprior(X)
 
+    def _verbose(self, level):
+        """
+        Whether messages of the given verbosity ``level`` are to be printed, i.e. if it
+        is equal or lower than the verbosity of the runner (always if ``level=None``).
+        """
+        return level is None or level <= self.verbose
+
     def log(self, msg, level=None):
         """
         Print a message if its verbosity level is equal or lower than the given one (or
         always if ``level=None``.
         """
-        if level is None or level <= self.verbose:
+        if self._verbose(level):
             print(msg)
 
     def ensure_paths(self, plots=False):
@@ -646,9 +706,9 @@ class Runner():
             self.plots_path = _plots_path
         if mpi.is_main_process:
             if self.checkpoint:
-                create_path(self.checkpoint, verbose=self.verbose >= 3)
+                create_path(self.checkpoint, verbose=self._verbose(3))
             if plots:
-                create_path(self.plots_path, verbose=self.verbose >= 3)
+                create_path(self.plots_path, verbose=self._verbose(3))
 
     @property
     def n_total_left(self):
@@ -663,23 +723,27 @@ class Runner():
     def banner(self, text, max_line_length=79, prefix="| ", suffix=" |",
                header="=", footer="=", level=3):
         """Creates an iteration banner."""
+        if not self._verbose(level):
+            return
         default_header_footer = "="
+        lines_out = []
         if header:
             if not isinstance(header, str):
                 header = default_header_footer
-            self.log(max_line_length * str(header), level=level)
-        text = text.strip("\n")
-        lines = text.split("\n")
-        for line in lines:
-            line = prefix + line
-            left_before_suffix = max_line_length - len(line) - len(suffix)
-            if left_before_suffix >= 0:
-                line += " " * left_before_suffix + suffix
-            self.log(line, level=level)
+            lines_out.append(max_line_length * str(header))
+        # Lines too long to fit the suffix are printed without it
+        width = max_line_length - len(suffix)
+        lines_out.extend(
+            (prefix + line).ljust(width) + suffix
+            if len(prefix + line) <= width else prefix + line
+            for line in text.strip("\n").split("\n")
+        )
         if footer:
             if not isinstance(footer, str):
                 footer = default_header_footer
-            self.log(max_line_length * str(footer), level=level)
+            lines_out.append(max_line_length * str(footer))
+        # Printed at once, to avoid interleaving with the output of other processes
+        self.log("\n".join(lines_out), level=level)
 
     def read_checkpoint(self, truth=None):
         """
@@ -713,7 +777,9 @@ class Runner():
         """
         if not mpi.multiple_processes:
             return
-        mpi.share_attr(self, "gpr", root=root)
+        # pylint: disable=protected-access
+        buffer_attrs = self.gpr._mpi_buffer_attrs
+        self.gpr = mpi.bcast_with_arrays(self.gpr, buffer_attrs, root=root)
         self.gpr.set_random_state(self.rng)
 
     def _share_convergence_from_main(self):
@@ -723,16 +789,15 @@ class Runner():
         """
         if not mpi.multiple_processes:
             return
+        # Single broadcast: the MPI-aware criteria, and None for the rest.
         if mpi.is_main_process:
-            mpi_awareness = [cc.is_MPI_aware for cc in self.convergence]
+            mpi_aware_ccs = [cc if cc.is_MPI_aware else None for cc in self.convergence]
         else:
-            mpi_awareness = None
-        mpi_awareness = mpi.bcast(mpi_awareness)
+            mpi_aware_ccs = None
+        mpi_aware_ccs = mpi.bcast(mpi_aware_ccs)
         if not mpi.is_main_process:
-            self.convergence = [gpryconv.DummyMPIConvergeCriterion()] * len(mpi_awareness)
-        for i, (cc, is_MPI) in enumerate(zip(self.convergence, mpi_awareness)):
-            if is_MPI:
-                self.convergence[i] = mpi.bcast(cc)
+            dummy = gpryconv.DummyMPIConvergeCriterion()
+            self.convergence = [dummy if cc is None else cc for cc in mpi_aware_ccs]
 
     def run(self):
         r"""
@@ -747,14 +812,14 @@ class Runner():
             if mpi.is_main_process:
                 self.banner("Drawing initial samples.")
             self.do_initial_training()
-            if mpi.is_main_process and self.verbose >= 4:
+            if mpi.is_main_process and self._verbose(4):
                 print("Initial training set")
                 print(self.gpr.training_set_as_df())
             # Check if any of the points in X_train are close to each other
             if len(self.gpr.X_train) > 1:
-                distances = np.linalg.norm(
-                    self.gpr.X_train[:, None] - self.gpr.X_train[None, :], axis=-1)
-                if np.any(distances < 1e-10):
+                # Distance to the nearest *other* point (the first neighbour is itself)
+                distances, _ = cKDTree(self.gpr.X_train).query(self.gpr.X_train, k=2)
+                if np.min(distances[:, 1]) < 1e-10:
                     self.log("Warning: Some of the initial training points are very close "
                              "to each other. This may lead to numerical instability in "
                              "the GP. Consider increasing the number of initial points or "
@@ -784,7 +849,7 @@ class Runner():
                     (f" (or {self.max_finite} finite)"
                      if self.max_finite < self.max_total else "") + "\n"
                 )
-            self.old_gpr = deepcopy(self.gpr)
+            self.old_gpr = copy(self.gpr)
             self.progress.add_current_n_truth(self.gpr.n_total, self.gpr.n_finite)
             # Acquire new points in parallel
             if mpi.is_main_process:
@@ -808,20 +873,23 @@ class Runner():
                 if len(y_pred) > 0:
                     in_training_set, duplicates = check_candidates(self.gpr, new_X)
                     if mpi.is_main_process:
-                        if np.any(in_training_set):
+                        n_in_training_set = np.count_nonzero(in_training_set)
+                        if n_in_training_set:
                             self.log(
-                                f"{np.sum(in_training_set)} of the proposed points are "
+                                f"{n_in_training_set} of the proposed points are "
                                 "already in the training set. Skipping them.",
                                 level=2,
                             )
-                        if np.any(duplicates):
+                        n_duplicates = np.count_nonzero(duplicates)
+                        if n_duplicates:
                             self.log(
-                                f"{np.sum(duplicates)} of the proposed points appear "
+                                f"{n_duplicates} of the proposed points appear "
                                 "multiple times. Skipping them.",
                                 level=2
                             )
                     # make boolean mask of points to keep
-                    keep = np.logical_not(np.logical_or(in_training_set, duplicates))
+                    keep = np.logical_or(in_training_set, duplicates)
+                    np.logical_not(keep, out=keep)
                     # TODO: test for points that will not add much: cut list when
                     #       acq(top) - acq(i) is large enough.
                     #       Maybe integrate in check_candidates
@@ -842,9 +910,11 @@ class Runner():
             if mpi.is_main_process:
                 self.log(f"[ACQUISITION] ({timer_acq.time:.2g} sec) Proposed {len(new_X)}"
                          " point(s) for truth evaluation.", level=3)
-                self.log("New location(s) proposed, as [X, logp_gp(X), acq(X)]:", level=4)
-                for X, y, acq in zip(new_X, y_pred, acq_vals):
-                    self.log(f"   {X} {y} {acq}", level=4)
+                if self._verbose(4):
+                    self.log("New location(s) proposed, as [X, logp_gp(X), acq(X)]:",
+                             level=4)
+                    for X, y, acq in zip(new_X, y_pred, acq_vals):
+                        self.log(f"   {X} {y} {acq}", level=4)
             # Checks how many candidates have been returned and if it's
             # less than half of the number requested (or less than 2 if only 2 requested),
             # force the acquisition to re-sample until either getting more points or
@@ -862,6 +932,8 @@ class Runner():
                         no_more_candidates = True
                 no_more_candidates = mpi.bcast(no_more_candidates)
                 if no_more_candidates:
+                    # Checkpoint may be outdated if saved less than every iteration
+                    self.save_checkpoint()
                     break
                 if mpi.is_main_process:
                     self.log("Acquisition returned less than half of the requested "
@@ -883,7 +955,6 @@ class Runner():
             if mpi.is_main_process:
                 self.progress.add_truth(timer_truth.time, len(new_X))
                 self.log(f"[EVALUATION] ({timer_truth.time:.2g} sec) {eval_msg}", level=3)
-            mpi.sync_processes()
             # Add the newly evaluated truths to the GPR, and maybe refit hyperparameters.
             if mpi.is_main_process:
                 self.log("[FIT] Starting GPR fit...", level=4)
@@ -892,9 +963,11 @@ class Runner():
             if mpi.is_main_process:
                 self.progress.add_fit(timer_fit.time, timer_fit.evals_loglike)
                 self.log(f"[FIT] ({timer_fit.time:.2g} sec) {fit_msg}", level=3)
-                self.log(f"Current maximum log-posterior: {self.gpr.y_max}", level=3)
-                self.log(f"Current GPR kernel: {self.gpr.kernel_}", level=3)
-            mpi.sync_processes()
+                if self._verbose(3):
+                    self.log(
+                        f"Current maximum log-posterior: {self.gpr.y_max}", level=3
+                    )
+                    self.log(f"Current GPR kernel: {self.gpr.kernel_}", level=3)
             # Share new_X, new_y and y_pred to the runner instance
             self.new_X, self.new_y, self.y_pred = mpi.bcast(
                 (new_X, new_y, y_pred) if mpi.is_main_process else (None, None, None))
@@ -912,13 +985,13 @@ class Runner():
                     if mpi.is_main_process:
                         self.log(f"[CALLBACK] ({timer_callback.time:.2g} sec) Evaluated "
                                  "the callback function.", level=3)
-                mpi.sync_processes()
             # Calculate convergence and break if the run has converged
-            mpi.sync_processes()
+            mpi.sync_processes()  # to sync the timer
             if mpi.is_main_process:
                 self.log("[CONVERGENCE] Starting convergence check...", level=4)
             with TimerCounter(self.gpr, self.old_gpr) as timer_convergence:
                 self._check_convergence_parallel(new_X, new_y, y_pred)
+                # The timer should cover all processes finishing the check
                 mpi.sync_processes()
             self.progress.add_convergence(
                 timer_convergence.time, timer_convergence.evals,
@@ -926,7 +999,7 @@ class Runner():
             )
             mpi.share_attr(self, "has_converged")
             if mpi.is_main_process:
-                if self.verbose >= 2:
+                if self._verbose(2):
                     last_values = "; ".join(
                         f"{cc.__class__.__name__} [{cc.convergence_policy}]: "
                         f"{cc.last_value:.2g} (limit {cc.limit:.2g})"
@@ -941,10 +1014,9 @@ class Runner():
                         self.log(
                             f"[CONVERGENCE] - {cc.__class__.__name__} "
                             f"[{cc.convergence_policy}]: {cc.last_value:.2g} "
-                            "(limit {cc.limit:.2g})",
+                            f"(limit {cc.limit:.2g})",
                             level=2
                         )
-            mpi.sync_processes()
             self.update_mean_cov()
             # Run the final MC sampler and perform a diagnosis
             if self.has_converged:
@@ -958,7 +1030,6 @@ class Runner():
                     if mpi.is_main_process:
                         self.log("[MC+DIAGNOSIS] MC sampler done. Diagnosing...", level=4)
                     diag_success = self.diagnose_last_mc_sample()
-                mpi.sync_processes()
                 if mpi.is_main_process:
                     self.log(
                         "[MC+DIAGNOSIS] Obtained MC sample. "
@@ -968,7 +1039,10 @@ class Runner():
                 if not diag_success:
                     self.has_converged = False
             self.progress.mpi_sync()
-            self.save_checkpoint()
+            if (self.current_iteration % self.checkpoint_every == 0 or
+                    self.has_converged or
+                    self.n_total_left <= 0 or self.n_finite_left <= 0):
+                self.save_checkpoint()
             if mpi.is_main_process and self.plots:
                 try:
                     if mpi.is_main_process:
@@ -1062,7 +1136,7 @@ class Runner():
         if mpi.multiple_processes:
             n_to_sample_per_process = mpi.bcast(
                 n_to_sample_per_process if mpi.is_main_process else None)
-        if n_to_sample_per_process == 0 and self.verbose > 1:  # Enough pre-training
+        if n_to_sample_per_process == 0 and self._verbose(2):  # Enough pre-training
             warnings.warn("The number of pretrained points exceeds the number of "
                           "initial samples")
             return
@@ -1073,48 +1147,65 @@ class Runner():
         mpi.sync_processes()  # to sync the timer
         with Timer() as timer_truth:
             if mpi.is_main_process:
+                from tqdm import tqdm  # pylint: disable=import-outside-toplevel
                 progress_bar = tqdm(total=n_still_needed)
+                # Collect chunks and concatenate once at the end
+                X_init_chunks = [X_init]
+                # Finiteness is relative to the max: keep track of both
+                y_max_init = np.max(y_init) if len(y_init) else -np.inf
+                n_finite_new = (
+                    int(np.count_nonzero(is_finite(y_max_init - y_init)))
+                    if len(y_init) else 0
+                )
             for i in range(n_iterations_before_giving_up):
-                X_init_loop = np.empty((0, self.d))
-                y_init_loop = np.empty(0)
-                for j in range(n_to_sample_per_process):
-                    # Draw a point from prior and evaluate logposterior at that point.
-                    # But check first if the point is within the priors.
-                    # NB: this check should be superseded by the corresponding ones in the
-                    #     proposer.py module, but left in case of using custom proposer.
-                    X_in_bounds = False
-                    proposer_tries = 0
-                    warn_multiple = 10 * self.gpr.d
-                    while not X_in_bounds:
-                        X = self.initial_proposer.get(rng=self.rng)
-                        X_in_bounds = is_in_bounds(
-                            X, self.prior_bounds, check_shape=False
-                        )[0]
-                        proposer_tries += 1
-                        if proposer_tries > 0 and proposer_tries > warn_multiple:
-                            self.log(
-                                "The initial proposer is having trouble finding "
-                                "points within the prior bounds "
-                                f"(#attempts={proposer_tries}). Consider changing "
-                                "the initial proposer or the prior bounds.",
-                                level=1
-                            )
-                    y = self.logpost_eval_and_report(X, level=4)
-                    X_init_loop = np.append(X_init_loop, np.atleast_2d(X), axis=0)
-                    y_init_loop = np.append(y_init_loop, y)
+                # Draw points from the initial proposer, all at once, and evaluate the
+                # log-posterior at them. But check first if the points are within the
+                # priors, and re-draw the ones that are not.
+                # NB: this check should be superseded by the corresponding ones in the
+                #     proposer.py module, but left in case of using custom proposer.
+                X_init_loop = np.empty((n_to_sample_per_process, self.d))
+                n_in_bounds = 0
+                # Warn if more than 10d draws per point are needed on average
+                proposer_draws = 0
+                warn_multiple = 10 * self.gpr.d * n_to_sample_per_process
+                while n_in_bounds < n_to_sample_per_process:
+                    n_draw = n_to_sample_per_process - n_in_bounds
+                    X = self.initial_proposer.get_many(n_draw, rng=self.rng)
+                    X = X[is_in_bounds(X, self.prior_bounds, check_shape=False)]
+                    X_init_loop[n_in_bounds:n_in_bounds + len(X)] = X
+                    n_in_bounds += len(X)
+                    proposer_draws += n_draw
+                    if proposer_draws > warn_multiple:
+                        self.log(
+                            "The initial proposer is having trouble finding "
+                            "points within the prior bounds "
+                            f"(#draws={proposer_draws} for "
+                            f"{n_to_sample_per_process} points). Consider changing "
+                            "the initial proposer or the prior bounds.",
+                            level=1
+                        )
+                y_init_loop = np.empty(n_to_sample_per_process)
+                for j, X in enumerate(X_init_loop):
+                    y_init_loop[j] = self.logpost_eval_and_report(X, level=4)
                 # Gather points and decide whether to break.
-                if mpi.multiple_processes:
-                    # GATHER keeps rank order (MPI standard): we can do X and y separately
-                    all_points = mpi.gather(X_init_loop)
-                    all_posts = mpi.gather(y_init_loop)
-                else:
-                    all_points = [X_init_loop]
-                    all_posts = [y_init_loop]
+                # GATHER keeps rank order (MPI standard): we can do X and y separately
+                new_points = mpi.gather_array(X_init_loop)
+                new_posts = mpi.gather_array(y_init_loop)
                 if mpi.is_main_process:
-                    X_init = np.concatenate([X_init, np.concatenate(all_points)])
-                    y_init = np.concatenate([y_init, np.concatenate(all_posts)])
-                    # Only finite values contribute to the number of initial samples
-                    n_finite_new = sum(is_finite(max(y_init) - y_init))
+                    X_init_chunks.append(new_points)
+                    y_init = np.concatenate([y_init, new_posts])
+                    # Only finite values contribute to the number of initial samples.
+                    # Older points need re-classifying only if the maximum has changed.
+                    y_max_new = max(y_max_init, np.max(new_posts))
+                    if y_max_new == y_max_init:
+                        n_finite_new += int(
+                            np.count_nonzero(is_finite(y_max_init - new_posts))
+                        )
+                    else:
+                        y_max_init = y_max_new
+                        n_finite_new = int(
+                            np.count_nonzero(is_finite(y_max_init - y_init))
+                        )
                     # NB: tqdm.update takes *increments*
                     progress_bar.update(n_finite_new - progress_bar.n)
                     # Break loop if the desired number of initial samples is reached
@@ -1128,6 +1219,7 @@ class Runner():
                     pass
         if mpi.is_main_process:
             progress_bar.close()
+            X_init = np.concatenate(X_init_chunks)
         if self.progress and mpi.is_main_process:
             self.progress.add_truth(timer_truth.time, len(X_init))
         if mpi.is_main_process:
@@ -1135,7 +1227,7 @@ class Runner():
                      f"Evaluated the true log-posterior at {len(X_init)} location(s)"
                      f", of which {n_finite_new} returned a finite value." +
                      (" Each MPI process evaluated at most "
-                      f"{max(len(p) for p in all_points)} locations."
+                      f"{n_to_sample_per_process} locations per round."
                       if mpi.multiple_processes else ""), level=3)
         if mpi.is_main_process:
             # Raise error if the number of initial samples hasn't been reached
@@ -1153,7 +1245,8 @@ class Runner():
                      " points, including GPR hyperparameters. "
                      f"{self.gpr.n_last_appended_finite} finite points were added to the "
                      "GPR.", level=3)
-            self.log(f"Current GPR kernel: {self.gpr.kernel_}", level=4)
+            if self._verbose(4):
+                self.log(f"Current GPR kernel: {self.gpr.kernel_}", level=4)
         # Broadcast results
         self._share_gpr()
         self.progress.mpi_sync()
@@ -1170,18 +1263,15 @@ class Runner():
         i_this_process = sum(n_evals_per_process[:mpi.RANK])
         new_X_this_process = new_X[i_this_process: i_this_process + n_this_process]
         # Perform the evaluations
-        new_y_this_process = np.empty(0)
-        for x in new_X_this_process:
-            logp = self.logpost_eval_and_report(x, level=4)
-            new_y_this_process = np.append(new_y_this_process, logp)
+        new_y_this_process = np.fromiter(
+            (self.logpost_eval_and_report(x, level=4) for x in new_X_this_process),
+            dtype=float, count=n_this_process,
+        )
         # Collect (if parallel) and append to the current model
         if mpi.multiple_processes:
             # GATHER keeps rank order (MPI standard): we can do X and y separately
-            new_Xs = mpi.gather(new_X_this_process)
-            new_ys = mpi.gather(new_y_this_process)
-            if mpi.is_main_process:
-                new_X = np.concatenate(new_Xs)
-                new_y = np.concatenate(new_ys)
+            new_X = mpi.gather_array(new_X_this_process)
+            new_y = mpi.gather_array(new_y_this_process)
             new_X, new_y = mpi.bcast(
                 (new_X, new_y) if mpi.is_main_process else (None, None))
         else:
@@ -1192,7 +1282,8 @@ class Runner():
                 f"Evaluated the true log-posterior at {len(new_X)} location(s)" +
                 (f" (at most {len(new_X_this_process)} per MPI process)"
                  if mpi.multiple_processes else "") +
-                f", of which {sum(np.isfinite(new_y))} returned a finite value."
+                f", of which {np.count_nonzero(np.isfinite(new_y))} returned a finite "
+                "value."
             )
         return new_y, eval_msg
 
@@ -1244,11 +1335,10 @@ class Runner():
             )
             lml = -np.inf
         # Pick best and share it
-        lmls = mpi.allgather((mpi.RANK, lml))
-        best_i = lmls[np.argmax([l for i, l in lmls])][0]
+        best_lml, best_i = mpi.allreduce_maxloc(lml)
         if mpi.is_main_process:
             self.log(
-                f"[{mpi.RANK}] Overall best log-marginal-likelihood {lmls[best_i][1]}",
+                f"[{mpi.RANK}] Overall best log-marginal-likelihood {best_lml}",
                 level=4,
             )
         self._share_gpr(root=best_i)
@@ -1407,14 +1497,20 @@ class Runner():
             if len(logpost) != len(self.fiducial_MC_X):
                 raise TypeError("`logpost` and `X` have different numbers of samples.")
             self.fiducial_MC_logpost = logpost
-            logprior = np.array([self.logprior(x) for x in self.fiducial_MC_X])
+            logprior = np.fromiter(
+                (self.logprior(x) for x in self.fiducial_MC_X), dtype=float,
+                count=len(self.fiducial_MC_X),
+            )
             self.fiducial_MC_loglike = self.fiducial_MC_logpost - logprior
         elif loglike is not None:
             loglike = np.atleast_1d(loglike).copy()
             if len(loglike) != len(self.fiducial_MC_X):
                 raise TypeError("`loglike` and `X` have different numbers of samples.")
             self.fiducial_MC_loglike = loglike
-            logprior = np.array([self.logprior(x) for x in self.fiducial_MC_X])
+            logprior = np.fromiter(
+                (self.logprior(x) for x in self.fiducial_MC_X), dtype=float,
+                count=len(self.fiducial_MC_X),
+            )
             self.fiducial_MC_logpost = self.fiducial_MC_loglike + logprior
 
     def _fiducial_MC_as_getdist(self):
@@ -1428,6 +1524,7 @@ class Runner():
             samples_dict, params=list(zip(self.params, self.labels)), bounds=self.prior_bounds
         )
 
+    @plot_in_main_process(warn=False)
     def plot_progress(
             self,
             ext="png",
@@ -1463,30 +1560,31 @@ class Runner():
             Creates a corner plot (contours for current GP shown only if using NORA).
             Slow -- use for diagnosis only.
         """
-        if not mpi.is_main_process:
-            return
-        self.ensure_paths(plots=True)
         # pylint: disable=import-outside-toplevel
         import matplotlib
         import matplotlib.pyplot as plt
+        import gpry.plots as gpplt
         if timing:
             self.progress.plot_timing(
                 truth=True, save=os.path.join(self.plots_path, f"timing.{ext}")
             )
         if convergence:
-            fig, ax = gpplt.plot_convergence(self.convergence)
-            plt.savefig(os.path.join(self.plots_path, f"convergence.{ext}"))
+            fig, _ = gpplt.plot_convergence(self.convergence)
+            fig.savefig(os.path.join(self.plots_path, f"convergence.{ext}"))
+            plt.close(fig)
         fid_MC = None
         if trace or corner and self.fiducial_MC_X is not None:
             fid_MC = self._fiducial_MC_as_getdist()
         if trace:
-            gpplt.plot_trace(
+            fig, _ = gpplt.plot_trace(
                 self.truth, self.gpr, self.convergence, self.progress, reference=fid_MC,
             )
-            plt.savefig(os.path.join(self.plots_path, f"trace.{ext}"))
+            fig.savefig(os.path.join(self.plots_path, f"trace.{ext}"))
+            plt.close(fig)
         if slices:
-            gpplt.plot_slices(self.truth, self.gpr, self.acquisition)
-            plt.savefig(os.path.join(self.plots_path, f"slices.{ext}"))
+            fig, _ = gpplt.plot_slices(self.truth, self.gpr, self.acquisition)
+            fig.savefig(os.path.join(self.plots_path, f"slices.{ext}"))
+            plt.close(fig)
         if corner:
             mc_samples = {}
             filled = {}
@@ -1521,13 +1619,16 @@ class Runner():
             output_corner = os.path.join(
                 self.plots_path, f"corner_it_{self.current_iteration:03d}.{ext}"
             )
-            # Temporarily switch to Agg backend
+            # Temporarily switch to Agg backend (switching closes all figures: skip if
+            # already using it, e.g. in headless runs)
             prev_backend = matplotlib.get_backend()
-            matplotlib.use("Agg")
+            switch_backend = prev_backend.lower() != "agg"
+            if switch_backend:
+                matplotlib.use("Agg")
             output_dpi = 200
             try:
                 if len(mc_samples) > 0:
-                    gpplt.plot_corner_getdist(
+                    gdplot = gpplt.plot_corner_getdist(
                         mc_samples,
                         params=list(self.params) + [mc._name_logp],
                         # bounds=self.prior_bounds,
@@ -1538,19 +1639,21 @@ class Runner():
                         output=output_corner,
                         output_dpi=output_dpi,
                     )
+                    plt.close(gdplot.fig)
                 else:
                     warnings.warn(
                         "No acquisition or fiducial sample to do the corner plot."
                     )
                 if self.has_converged:
-                    self.plot_mc(output_dpi=output_dpi, ext=ext)
+                    gdplot = self.plot_mc(output_dpi=output_dpi, ext=ext)
+                    plt.close(gdplot.fig)
             except Exception as excpt:  # pylint: disable=broad-exception-caught
                 # Usually fails with reweighted Acquisition samples
                 warnings.warn(str(excpt))
             finally:
                 # Switch back to prev backend
-                matplotlib.use(prev_backend)
-        plt.close("all")
+                if switch_backend:
+                    matplotlib.use(prev_backend)
 
     def generate_mc_sample(
             self, sampler="nested", output=None, add_options=None, resume=False
@@ -1605,6 +1708,7 @@ class Runner():
                 "'add_options' has been deprecated. Pass sampler options by specifying "
                 "the 'sampler' argument as a dictionary."
             )
+        self._last_mc_samples_getdist = None
         self._last_mc_bounds = self.truth.prior_bounds
         if self.gpr.trust_bounds is not None:
             self._last_mc_bounds = self.gpr.trust_bounds
@@ -1621,7 +1725,10 @@ class Runner():
                 verbose=self.verbose
             )
             if mpi.is_main_process:
-                logprior_MC = np.array([self.truth.logprior(x) for x in X_MC])
+                logprior_MC = np.fromiter(
+                    (self.truth.logprior(x) for x in X_MC), dtype=float,
+                    count=len(X_MC),
+                )
                 self._last_mc_samples = {
                     "w": w_MC,
                     "X": X_MC,
@@ -1651,7 +1758,10 @@ class Runner():
             )
             if mpi.is_main_process:
                 X_MC = _last_mc_samples_cobaya[self.truth.params].to_numpy()
-                logprior_MC = np.array([self.truth.logprior(x) for x in X_MC])
+                logprior_MC = np.fromiter(
+                    (self.truth.logprior(x) for x in X_MC), dtype=float,
+                    count=len(X_MC),
+                )
                 y_MC = -_last_mc_samples_cobaya["minuslogpost"].to_numpy()
                 self._last_mc_samples = {
                     "w": _last_mc_samples_cobaya["weight"].to_numpy(),
@@ -1671,18 +1781,41 @@ class Runner():
 
         If ``None`` is stored as weights, all samples should be assumed to have equal
         weight.
+
+        If ``as_getdist=True``, returns a ``getdist.MCSamples`` instance instead. With
+        ``copy=False`` it is created only once per MC sample and shared between calls,
+        so it should not be modified; with ``copy=True`` a new instance is created from
+        copies of the sample arrays.
         """
         if as_getdist:
-            return mc.samples_dict_to_getdist(
-                self.last_mc_samples(copy=False, as_getdist=False),
-                params=list(zip(self.truth.params, self.truth.labels)),
-                bounds=self._last_mc_bounds,
-                sampler_type=self._last_mc_sampler_type,
-            )
+            if copy:
+                return self._mc_samples_to_getdist(self.last_mc_samples(copy=True))
+            # Keyed on the samples dict, so that it is rebuilt whenever
+            # ``_last_mc_samples`` is reassigned
+            cached = self._last_mc_samples_getdist
+            if cached is None or cached[0] is not self._last_mc_samples:
+                cached = (
+                    self._last_mc_samples,
+                    self._mc_samples_to_getdist(self._last_mc_samples),
+                )
+                self._last_mc_samples_getdist = cached
+            return cached[1]
         if copy:
             return deepcopy(self._last_mc_samples)
         return self._last_mc_samples
 
+    def _mc_samples_to_getdist(self, samples_dict):
+        """
+        Converts an MC sample dict, as stored by :func:`Runner.generate_mc_sample`, into
+        a ``getdist.MCSamples`` instance.
+        """
+        return mc.samples_dict_to_getdist(
+            samples_dict,
+            params=list(zip(self.truth.params, self.truth.labels)),
+            bounds=self._last_mc_bounds,
+            sampler_type=self._last_mc_sampler_type,
+        )
+
     def diagnose_last_mc_sample(self):
         """
         Diagnoses the last MC sample to check consistency.
@@ -1707,21 +1840,22 @@ class Runner():
                 mean_last_mc, mean_training, cov_last_mc
             )
             success = 0 < cred < 0.5
-        success = mpi.bcast(success if mpi.is_main_process else None)
-        if not hasattr(self.acquisition, "last_MC_sample"):
-            return success
-        if mpi.is_main_process:
-            X, _, _, w = self.acquisition.last_MC_sample(warn_reweight=False)
-            try:
-                mean_acq = np.average(X, weights=w, axis=0)
-                cov_acq = np.atleast_2d(np.cov(X.T, aweights=w, ddof=0))
-            except (ValueError, TypeError):
-                pass  # If failed, consider training test sufficient
-            else:
-                success &= kl_norm(mean_last_mc, cov_last_mc, mean_acq, cov_acq) < self.d
+            if hasattr(self.acquisition, "last_MC_sample_mean_cov"):
+                try:
+                    mean_acq, cov_acq = self.acquisition.last_MC_sample_mean_cov(
+                        copy=False
+                    )
+                except (ValueError, TypeError):
+                    pass  # If failed, consider training test sufficient
+                else:
+                    success &= (
+                        kl_norm(mean_last_mc, cov_last_mc, mean_acq, cov_acq) < self.d
+                    )
+        # All tests are done by the main process: share the result just once.
         success = mpi.bcast(success if mpi.is_main_process else None)
         return success
 
+    @plot_in_main_process()
     def plot_mc(self, samples_or_samples_folder=None, add_training=True,
                 add_samples=None, output=None, output_dpi=200, ext="png"):
         """
@@ -1755,12 +1889,6 @@ class Runner():
         ext : str (default: "png" if `output` not defined; else ignore)
             Format for the plot.
         """
-        if not mpi.is_main_process:
-            warnings.warn(
-                "Running plotting function from non-root MPI process. Doing nothing."
-            )
-            return
-        self.ensure_paths(plots=True)
         mc_samples = {}
         if self.fiducial_MC_X is not None:
             mc_samples["Fiducial"] = self._fiducial_MC_as_getdist()
@@ -1772,7 +1900,7 @@ class Runner():
                     "the generate_mc_sample() method first, or pass samples or a path "
                     "to them as first argument."
                 )
-            mc_samples[base_label] = self.last_mc_samples(as_getdist=True)
+            mc_samples[base_label] = self.last_mc_samples(copy=False, as_getdist=True)
         else:
             mc_samples[base_label] = samples_or_samples_folder
         if add_samples is None:
@@ -1791,6 +1919,7 @@ class Runner():
             list(self.params) + [mc._name_logp]
         if output is None:
             output = os.path.join(self.plots_path, f"Surrogate_triangle.{ext}")
+        import gpry.plots as gpplt  # pylint: disable=import-outside-toplevel
         gdplot = gpplt.plot_corner_getdist(
             mc_samples,
             params=plot_params,
@@ -1802,6 +1931,7 @@ class Runner():
         )
         return gdplot
 
+    @plot_in_main_process()
     def plot_distance_distribution(
             self, samples_or_samples_folder=None, show_added=True, output=None,
             output_dpi=200, ext="png"):
@@ -1833,11 +1963,6 @@ class Runner():
         ext : str (default: "png" if `output` not defined; else ignore)
             Format for the plot
         """
-        if not mpi.is_main_process:
-            warnings.warn(
-                "Running plotting function from non-root MPI process. Doing nothing."
-            )
-            return
         if samples_or_samples_folder is None:
             if self._last_mc_samples is None:
                 raise ValueError(
@@ -1845,14 +1970,13 @@ class Runner():
                     "the generate_mc_sample() method first, or pass samples or a path "
                     "to them as first argument."
                 )
-            gdsample = self.last_mc_samples(as_getdist=True)
+            gdsample = self.last_mc_samples(copy=False, as_getdist=True)
         else:
             gdsample = samples_or_samples_folder
         gdsample = list(mc.process_gdsamples({None: gdsample}).values())[0]
         n_params = len(self.params)
         mean = gdsample.getMeans()[:n_params]
         covmat = gdsample.getCovMat().matrix[:n_params, :n_params]
-        self.ensure_paths(plots=True)
         if output is None:
             output_1 = os.path.join(
                 self.plots_path, f"Distance_distribution.{ext}"
@@ -1865,10 +1989,18 @@ class Runner():
             # We need to change the 2nd NameError
             name, ext = os.path.splitext(output)
             output_2 = name + "_density" + ext
-        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
-        fig, ax = gpplt.plot_distance_distribution(
-            self.gpr, mean, covmat, density=False, show_added=show_added)
-        plt.savefig(output_1, dpi=output_dpi)
-        fig, ax = gpplt.plot_distance_distribution(
-            self.gpr, mean, covmat, density=True, show_added=show_added)
-        plt.savefig(output_2, dpi=output_dpi)
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pyplot as plt
+        import gpry.plots as gpplt
+        # Computed once for both plots
+        radial_distances = gaussian_distance(self.gpr.X_train, mean, covmat)
+        fig, _ = gpplt.plot_distance_distribution(
+            self.gpr, mean, covmat, density=False, show_added=show_added,
+            radial_distances=radial_distances)
+        fig.savefig(output_1, dpi=output_dpi)
+        plt.close(fig)
+        fig, _ = gpplt.plot_distance_distribution(
+            self.gpr, mean, covmat, density=True, show_added=show_added,
+            radial_distances=radial_distances)
+        fig.savefig(output_2, dpi=output_dpi)
+        plt.close(fig)
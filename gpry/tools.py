@@ -6,12 +6,14 @@ from copy import deepcopy
 from inspect import signature
 import inspect
 from typing import Mapping, Iterable
+from numbers import Number
 from warnings import warn
 
 import numpy as np
 from numpy import trace as tr
 from numpy.linalg import det
-from scipy.linalg import eigh
+from scipy.linalg import eigh, cholesky, solve_triangular
+from scipy.spatial import cKDTree
 from scipy.special import gamma, erfc
 from scipy.stats import chi2
 from sklearn.utils import check_random_state as check_random_state_sklearn
@@ -86,15 +88,11 @@ def gaussian_distance(points, mean, covmat):
         f"mean.shape={mean.shape} and covmat.shape={covmat.shape}."
     )
     assert is_valid_covmat(covmat), "Covmat passed is not a valid covariance matrix."
-    # Transform to normalised gaussian
-    std_diag = np.diag(np.sqrt(np.diag(covmat)))
-    invstd_diag = np.linalg.inv(std_diag)
-    corrmat = invstd_diag.dot(covmat).dot(invstd_diag)
-    Lscalefree = np.linalg.cholesky(corrmat)
-    L = np.linalg.inv(std_diag).dot(Lscalefree)
-    points_transf = L.dot((points - mean).T).T
+    # Transform to normalised gaussian: with covmat = L L^T, solve L z = (x - mean)
+    L = cholesky(covmat, lower=True)
+    points_transf = solve_triangular(L, (np.atleast_2d(points) - mean).T, lower=True)
     # Compute distance
-    return np.sqrt(np.sum(points_transf**2, axis=1))
+    return np.sqrt(np.sum(points_transf**2, axis=0))
 
 
 def nstd_of_1d_nstd(n1, d, warn_inf=True):
@@ -195,6 +193,9 @@ def get_Xnumber(value, X_letter, X_value=None, dtype=int, varname=None):
         )
     if not isinstance(dtype, type):
         raise ValueError(f"'dtype' arg must be a type, not {type(dtype)}.")
+    # Fast path: plain numbers need no parsing
+    if isinstance(value, Number) and X_value is not None:
+        return dtype(value)
     if value == X_letter:
         value = "1" + X_letter
     # Avoid exceptions until the 'try' block
@@ -249,14 +250,13 @@ def check_candidates(gpr, new_X, tol=1e-8):
 
     new_X_r = np.round(new_X, decimals=int(-np.log10(tol)))
     X_train_r = np.round(X_train, decimals=int(-np.log10(tol)))
-    in_training_set = np.any(np.all(X_train_r[:, None, :] == new_X_r, axis=2), axis=0)
-
-    unique_rows, indices, counts = np.unique(
-        new_X_r, axis=0, return_index=True, return_counts=True
-    )
-    is_duplicate = counts > 1
-    duplicates = np.isin(new_X_r, unique_rows[is_duplicate]).all(axis=1)
-    duplicates[indices[is_duplicate]] = False
+    # Rounded points coincide iff their distance is exactly zero
+    distances, _ = cKDTree(X_train_r).query(new_X_r, k=1, distance_upper_bound=tol)
+    in_training_set = distances == 0
+    # All but the first occurrence of each point are flagged as duplicates
+    _, indices = np.unique(new_X_r, axis=0, return_index=True)
+    duplicates = np.ones(len(new_X_r), dtype=bool)
+    duplicates[indices] = False
     return in_training_set, duplicates
 
 
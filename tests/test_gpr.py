@@ -0,0 +1,64 @@
+"""
+Tests for the GP regressor.
+"""
+
+from copy import copy
+
+import numpy as np
+
+from model_generator import Random_gaussian
+
+from gpry.gpr import GaussianProcessRegressor
+from gpry.preprocessing import Normalize_bounds, Normalize_y
+
+
+def _fitted_gpr(dim=2, n=10, seed=0):
+    generator = Random_gaussian(ndim=dim)
+    generator.redraw(seed)
+    bounds = np.array([[-10, 10]] * dim)
+    gpr = GaussianProcessRegressor(
+        bounds=bounds,
+        preprocessing_X=Normalize_bounds(bounds),
+        preprocessing_y=Normalize_y(),
+        account_for_inf="SVM",
+        n_restarts_optimizer=2,
+        random_state=np.random.default_rng(seed),
+    )
+    X = generator.rv.rvs(n, random_state=seed)
+    gpr.append_to_data(X, generator.rv.logpdf(X))
+    return gpr, generator
+
+
+def test_copy_unaffected_by_append():
+    gpr, generator = _fitted_gpr()
+    gpr_copy = copy(gpr)
+    attrs = [
+        "X_train", "y_train", "X_train_all", "y_train_all", "L_", "V_", "alpha_"
+    ]
+    before = {attr: np.copy(getattr(gpr, attr)) for attr in attrs}
+    theta_before = np.copy(gpr.kernel_.theta)
+    X_test = generator.rv.rvs(5, random_state=1)
+    predict_before = gpr.predict(X_test, return_std=True)
+    rng_state_before = gpr_copy.random_state.bit_generator.state
+    # Append (with a -inf value, to refit the classifier too) and refit the original
+    X_new = generator.rv.rvs(5, random_state=2)
+    y_new = generator.rv.logpdf(X_new)
+    y_new[0] = -np.inf
+    gpr.append_to_data(X_new, y_new)
+    assert gpr.n_total == len(before["y_train_all"]) + len(y_new)
+    for attr in attrs:
+        assert np.array_equal(getattr(gpr_copy, attr), before[attr])
+    assert np.array_equal(gpr_copy.kernel_.theta, theta_before)
+    for value, value_before in zip(gpr_copy.predict(X_test, return_std=True),
+                                   predict_before):
+        assert np.array_equal(value, value_before)
+    # Refitting the original does not advance the random stream of the copy...
+    assert gpr_copy.random_state.bit_generator.state == rng_state_before
+    # ...nor the other way round
+    rng_state_orig = gpr.random_state.bit_generator.state
+    gpr_copy.fit_gpr_hyperparameters()
+    assert gpr.random_state.bit_generator.state == rng_state_orig
+    assert (
+        gpr.infinities_classifier.random_state is not
+        gpr_copy.infinities_classifier.random_state
+    )
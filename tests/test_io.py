@@ -69,3 +69,81 @@ def test_io(load_checkpoint, convergence_criterion):
     _test_io(
         load_checkpoint, convergence_criterion=convergence_criterion, options=options
     )
+
+
+def _gaussian_loglike(x, y):
+    return -0.5 * (x**2 + (y - 0.5) ** 2) / 0.2**2
+
+
+@pytest.mark.parametrize("stop", ["budget", "converged", "give_up"])
+@pytest.mark.parametrize("checkpoint_every", [None, 3])
+def test_checkpoint_every(stop, checkpoint_every, tmp_path, monkeypatch):
+    # Iteration at which the run converges, or after which the acquisition stops
+    # returning points (giving up 2 re-samples later, at iteration 6)
+    stop_iteration = {"budget": None, "converged": 4, "give_up": 4}[stop]
+    options = {"n_initial": 6, "max_initial": 12, "n_points_per_acq": 2}
+    options["max_total"] = 16 if stop == "budget" else 100
+    if checkpoint_every is not None:
+        options["checkpoint_every"] = checkpoint_every
+    checkpoint = str(tmp_path / "chk")
+    runner = Runner(
+        _gaussian_loglike,
+        bounds=[[-1, 1], [-1, 1]],
+        convergence_criterion="DontConverge",
+        options=options,
+        checkpoint=checkpoint,
+        load_checkpoint="overwrite",
+        seed=1,
+        verbose=0,
+    )
+    assert runner.checkpoint_every == (checkpoint_every or 1)
+    saved = []
+    original_save_checkpoint = Runner.save_checkpoint
+
+    def save_checkpoint(self, *args, **kwargs):
+        saved.append((self.current_iteration, self.gpr.n_total))
+        original_save_checkpoint(self, *args, **kwargs)
+
+    monkeypatch.setattr(Runner, "save_checkpoint", save_checkpoint)
+    # The final MC sample is not needed
+    monkeypatch.setattr(Runner, "generate_mc_sample", lambda self, **kwargs: None)
+    monkeypatch.setattr(Runner, "diagnose_last_mc_sample", lambda self: True)
+    if stop == "converged":
+        original_check_convergence = Runner._check_convergence_parallel
+
+        def check_convergence(self, *args):
+            original_check_convergence(self, *args)
+            self.has_converged = self.current_iteration >= stop_iteration
+
+        monkeypatch.setattr(Runner, "_check_convergence_parallel", check_convergence)
+    elif stop == "give_up":
+        acquisition_class = type(runner.acquisition)
+        original_multi_add = acquisition_class.multi_add
+
+        def multi_add(self, gpr, *args, **kwargs):
+            if runner.current_iteration < stop_iteration:
+                return original_multi_add(self, gpr, *args, **kwargs)
+            return np.empty((0, gpr.d)), np.empty(0), np.empty(0)
+
+        monkeypatch.setattr(acquisition_class, "multi_add", multi_add)
+    runner.run()
+    final_iteration = runner.current_iteration
+    if stop == "budget":
+        assert runner.n_total_left <= 0
+    elif stop == "converged":
+        assert runner.has_converged and final_iteration == stop_iteration
+    else:
+        assert final_iteration == stop_iteration + runner.n_resamples_before_giveup
+    k = runner.checkpoint_every
+    # Saved after the initial training, every k iterations, and at the end. Iterations
+    # that only re-sample the acquisition are not saved.
+    last_full_iteration = stop_iteration - 1 if stop == "give_up" else final_iteration
+    expected = [0] + [i for i in range(1, last_full_iteration + 1) if i % k == 0]
+    if expected[-1] != final_iteration:
+        expected.append(final_iteration)
+    assert [iteration for iteration, _ in saved] == expected
+    # The final state is always saved
+    assert saved[-1][1] == runner.gpr.n_total
+    _, gpr, _, _, _, _ = read_checkpoint(checkpoint)
+    assert gpr.n_total == runner.gpr.n_total
+    assert np.array_equal(gpr.X_train_all, runner.gpr.X_train_all)
@@ -0,0 +1,82 @@
+"""
+Tests for the fast cross-covariance path of the RBF and Matern kernels, against the
+scikit-learn implementation.
+"""
+
+import pytest
+import numpy as np
+from scipy.stats import multivariate_normal
+from sklearn.gaussian_process.kernels import RBF as sk_RBF
+from sklearn.gaussian_process.kernels import Matern as sk_Matern
+
+from gpry.kernels import RBF, Matern
+from gpry.gpr import GaussianProcessRegressor
+from gpry.preprocessing import Normalize_bounds, Normalize_y
+
+# Spans the default length_scale_prior of the GPR, [1e-3, 1e1]
+length_scales = [1e-3, 1e-2, 1e-1, 1, 1e1]
+
+
+def _kernel_pairs(length_scale):
+    return [
+        (RBF(length_scale), sk_RBF(length_scale)),
+        (Matern(length_scale, nu=0.5), sk_Matern(length_scale, nu=0.5)),
+        (Matern(length_scale, nu=1.5), sk_Matern(length_scale, nu=1.5)),
+        (Matern(length_scale, nu=2.5), sk_Matern(length_scale, nu=2.5)),
+    ]
+
+
+@pytest.mark.parametrize("offset", [0, 1e2])
+@pytest.mark.parametrize("length_scale", length_scales)
+def test_cross_covariance(length_scale, offset):
+    rng = np.random.default_rng(0)
+    dim = 3
+    X = rng.random((50, dim)) + offset
+    Y = rng.random((40, dim)) + offset
+    # Some (nearly) coincident pairs, where the round-off of the expansion is largest
+    X[:5] = Y[:5]
+    X[5:10] = Y[5:10] + 1e-4 * length_scale
+    # Rounding of the inputs themselves limits the precision for large offsets
+    atol = 1e-12 * max(1, offset)
+    for kernel, sk_kernel in _kernel_pairs(length_scale):
+        assert np.allclose(kernel(X, Y), sk_kernel(X, Y), rtol=0, atol=atol)
+        # Anisotropic length scales
+        aniso = np.array([1, 2, 0.5]) * length_scale
+        kernel.length_scale, sk_kernel.length_scale = aniso, aniso
+        assert np.allclose(kernel(X, Y), sk_kernel(X, Y), rtol=0, atol=atol)
+
+
+@pytest.mark.parametrize("kernel_name", ["RBF", "Matern"])
+def test_predict_std(kernel_name, monkeypatch):
+    dim = 3
+    bounds = np.array([[90, 110]] * dim)
+    rv = multivariate_normal(100 * np.ones(dim), np.eye(dim))
+    gpr = GaussianProcessRegressor(
+        kernel=kernel_name,
+        bounds=bounds,
+        preprocessing_X=Normalize_bounds(bounds),
+        preprocessing_y=Normalize_y(),
+        n_restarts_optimizer=2,
+        random_state=0,
+    )
+    X = rv.rvs(40, random_state=1)
+    gpr.append_to_data(X, rv.logpdf(X))
+    # Low-variance locations (at and near training points) and generic ones
+    X_test = np.concatenate(
+        [X[:10], X[:10] + 1e-9, X[:10] + 1e-4, rv.rvs(50, random_state=2)]
+    )
+    kernel_class, sk_kernel_class = (
+        (RBF, sk_RBF) if kernel_name == "RBF" else (Matern, sk_Matern)
+    )
+    for length_scale in length_scales:
+        gpr.kernel_.k2.length_scale = np.full(dim, length_scale)
+        K = gpr.kernel_(gpr.X_train_)
+        K[np.diag_indices_from(K)] += gpr.alpha
+        gpr._kernel_inverse(K)
+        mean, std = gpr.predict(X_test, return_std=True)
+        with monkeypatch.context() as m:
+            m.setattr(kernel_class, "__call__", sk_kernel_class.__call__)
+            sk_mean, sk_std = gpr.predict(X_test, return_std=True)
+        # The remaining differences come from the conditioning of the kernel matrix
+        assert np.allclose(mean, sk_mean, rtol=1e-6, atol=1e-8)
+        assert np.allclose(std, sk_std, rtol=1e-3, atol=1e-8)
@@ -0,0 +1,236 @@
+"""
+Tests for the MPI communication helpers.
+
+The single-process paths are tested directly. The multi-process paths are exercised
+with fake communicators that record what the root process sends and replay it in a
+receiving process, so that the (un)packing logic can be tested without MPI, and with a
+real run under ``mpiexec`` if mpi4py is installed.
+"""
+
+import os
+import sys
+import pickle
+import shutil
+import subprocess
+from textwrap import dedent
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+
+from gpry import mpi
+
+
+class _Holder:
+    """Object with array, non-array and ``None`` attributes."""
+
+    def __init__(self):
+        self.floats = np.arange(12, dtype=float).reshape(4, 3)
+        self.ints = np.arange(5, dtype=np.int32)
+        self.strided = np.arange(20, dtype=float).reshape(5, 4)[:, ::2]
+        self.objects = np.array([{"a": 1}, None, "b"], dtype=object)
+        self.empty = np.empty((0, 3))
+        self.missing = None
+        self.other = {"key": [1, 2]}
+
+
+_array_attrs = ("floats", "ints", "strided", "objects", "empty", "missing", "absent")
+
+
+class _RecordingComm:
+    """Root side of a broadcast: records the messages sent."""
+
+    def __init__(self):
+        self.messages = []
+
+    def bcast(self, obj, root=0):
+        self.messages.append(pickle.dumps(obj))
+        return obj
+
+    def Bcast(self, buffer, root=0):
+        self.messages.append(np.copy(buffer))
+
+
+class _ReplayingComm:
+    """Receiving side of a broadcast: replays the recorded messages."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    def bcast(self, obj, root=0):
+        return pickle.loads(self.messages.pop(0))
+
+    def Bcast(self, buffer, root=0):
+        buffer[...] = self.messages.pop(0)
+
+
+def _assert_same_attrs(obj, reference):
+    assert set(vars(obj)) == set(vars(reference))
+    for attr, value in vars(reference).items():
+        if isinstance(value, np.ndarray):
+            received = getattr(obj, attr)
+            assert isinstance(received, np.ndarray)
+            assert received.dtype == value.dtype and received.shape == value.shape
+            assert np.array_equal(received, value)
+        else:
+            assert getattr(obj, attr) == value
+
+
+def test_bcast_with_arrays_single_process():
+    obj = _Holder()
+    assert mpi.bcast_with_arrays(obj, _array_attrs) is obj
+    _assert_same_attrs(obj, _Holder())
+
+
+def test_bcast_with_arrays_round_trip(monkeypatch):
+    monkeypatch.setattr(mpi, "multiple_processes", True)
+    # Root process
+    monkeypatch.setattr(mpi, "RANK", 0)
+    recorder = _RecordingComm()
+    monkeypatch.setattr(mpi, "comm", recorder)
+    obj = _Holder()
+    objects_before = obj.objects
+    sent = mpi.bcast_with_arrays(obj, _array_attrs)
+    assert sent is obj
+    _assert_same_attrs(obj, _Holder())
+    # Numerical arrays are sent as buffers, not pickled with the rest of the object;
+    # object arrays are pickled.
+    assert obj.objects is objects_before
+    pickled, _ = pickle.loads(recorder.messages[0])
+    assert all(getattr(pickled, attr) is None for attr in ["floats", "ints", "empty"])
+    assert np.array_equal(pickled.objects, obj.objects)
+    # Receiving process
+    monkeypatch.setattr(mpi, "RANK", 1)
+    monkeypatch.setattr(mpi, "comm", _ReplayingComm(recorder.messages))
+    received = mpi.bcast_with_arrays(None, _array_attrs)
+    _assert_same_attrs(received, _Holder())
+
+
+def test_gather_array(monkeypatch):
+    arr = np.arange(12, dtype=float).reshape(6, 2)[::2]
+    gathered = mpi.gather_array(arr)
+    assert gathered.flags.c_contiguous
+    assert np.array_equal(gathered, arr)
+
+    # Single-rank communicator, through the Gatherv path
+    def fake_gatherv(sendbuf, recvbuf, root=0):
+        gathered, counts = recvbuf
+        assert counts.tolist() == [sendbuf.size]
+        gathered[...] = sendbuf
+
+    monkeypatch.setattr(mpi, "multiple_processes", True)
+    monkeypatch.setattr(
+        mpi, "comm", SimpleNamespace(gather=lambda x, root=0: [x], Gatherv=fake_gatherv)
+    )
+    for arr in [np.arange(12, dtype=float).reshape(3, 2, 2), np.arange(4)]:
+        gathered = mpi.gather_array(arr)
+        assert gathered.dtype == arr.dtype
+        assert np.array_equal(gathered, arr)
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([1.5, 3.0, -2.0], (3.0, 1)),
+        ([2.0, 2.0, 1.0], (2.0, 0)),  # ties: lowest rank
+        ([-np.inf, -1.0], (-1.0, 1)),
+    ],
+)
+def test_allreduce_maxloc(values, expected, monkeypatch):
+    assert mpi.allreduce_maxloc(2.5) == (2.5, mpi.RANK)
+
+    # Emulates the reduction across processes, with values[i] held by rank i
+    def fake_allreduce(sendbuf, recvbuf, op=None):
+        buffer, _ = recvbuf
+        assert buffer["value"][0] == values[mpi.RANK]
+        assert buffer["rank"][0] == mpi.RANK
+        i_max = int(np.argmax(values))  # lowest rank for ties, as MAXLOC
+        buffer["value"][0], buffer["rank"][0] = values[i_max], i_max
+
+    monkeypatch.setattr(mpi, "multiple_processes", True)
+    monkeypatch.setattr(mpi, "comm", SimpleNamespace(Allreduce=fake_allreduce))
+    monkeypatch.setattr(
+        mpi, "MPI", SimpleNamespace(IN_PLACE=None, DOUBLE_INT=None, MAXLOC=None),
+        raising=False,
+    )
+    for rank, value in enumerate(values):
+        monkeypatch.setattr(mpi, "RANK", rank)
+        result = mpi.allreduce_maxloc(value)
+        assert result == expected
+        assert isinstance(result[0], float) and isinstance(result[1], int)
+
+
+_mpi_script = dedent(
+    """
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from gpry import mpi
+
+    assert mpi.SIZE == 2, mpi.SIZE
+
+    # allreduce_maxloc
+    assert mpi.allreduce_maxloc([1.5, 3.0][mpi.RANK]) == (3.0, 1)
+    assert mpi.allreduce_maxloc(2.0) == (2.0, 0)  # ties: lowest rank
+    assert mpi.allreduce_maxloc([-np.inf, -1.0][mpi.RANK]) == (-1.0, 1)
+    value, rank = mpi.allreduce_maxloc([-3.0, -5.0][mpi.RANK])
+    assert (value, rank) == (-3.0, 0)
+    assert isinstance(value, float) and isinstance(rank, int)
+
+    # gather_array, with one of the processes holding no rows
+    for arrays in [
+        [np.arange(12, dtype=float).reshape(3, 2, 2), np.empty((0, 2, 2))],
+        [np.empty(0, dtype=np.int32), np.arange(4, dtype=np.int32)],
+        [np.arange(6, dtype=float).reshape(3, 2), np.arange(6, 10.).reshape(2, 2)],
+    ]:
+        gathered = mpi.gather_array(arrays[mpi.RANK])
+        if mpi.RANK == 0:
+            assert gathered.dtype == arrays[0].dtype
+            assert np.array_equal(gathered, np.concatenate(arrays))
+        else:
+            assert gathered is None
+
+    # bcast_with_arrays
+    def holder():
+        return SimpleNamespace(
+            floats=np.arange(12, dtype=float).reshape(4, 3),
+            ints=np.arange(5, dtype=np.int32),
+            strided=np.arange(20, dtype=float).reshape(5, 4)[:, ::2],
+            objects=np.array([{"a": 1}, None, "b"], dtype=object),
+            empty=np.empty((0, 3)),
+            missing=None,
+            other={"key": [1, 2]},
+        )
+
+    attrs = ("floats", "ints", "strided", "objects", "empty", "missing", "absent")
+    received = mpi.bcast_with_arrays(holder() if mpi.RANK == 0 else None, attrs)
+    reference = holder()
+    assert set(vars(received)) == set(vars(reference))
+    for attr, value in vars(reference).items():
+        if isinstance(value, np.ndarray):
+            assert getattr(received, attr).dtype == value.dtype
+            assert np.array_equal(getattr(received, attr), value)
+        else:
+            assert getattr(received, attr) == value
+    """
+)
+
+
+def test_mpi_run(tmp_path):
+    pytest.importorskip("mpi4py")
+    mpiexec = shutil.which("mpiexec")
+    if mpiexec is None:
+        pytest.skip("mpiexec not found")
+    script = tmp_path / "mpi_script.py"
+    script.write_text(_mpi_script)
+    env = dict(os.environ)
+    gpry_path = os.path.dirname(os.path.dirname(os.path.abspath(mpi.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        [gpry_path] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    result = subprocess.run(
+        [mpiexec, "-n", "2", sys.executable, str(script)],
+        capture_output=True, text=True, env=env, timeout=300, check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,25 @@
+"""
+Tests for the proposers.
+"""
+
+import pytest
+import numpy as np
+
+from gpry.proposal import UniformProposer
+
+
+@pytest.mark.parametrize("dim", [1, 3])
+@pytest.mark.parametrize("n", [1, 10])
+def test_uniform_get_many(dim, n):
+    bounds = np.array([[-1, 2], [0, 1e-3], [10, 20]])[:dim]
+    proposer = UniformProposer(bounds)
+    rng_many, rng_one = np.random.default_rng(0), np.random.default_rng(0)
+    X = proposer.get_many(n, rng_many)
+    assert X.shape == (n, dim)
+    assert np.array_equal(X, [proposer.get(rng_one) for _ in range(n)])
+    assert np.all((X >= bounds[:, 0]) & (X <= bounds[:, 1]))
+    # Also after updating the bounds
+    proposer.update_bounds(bounds / 2)
+    X = proposer.get_many(n, rng_many)
+    assert np.array_equal(X, [proposer.get(rng_one) for _ in range(n)])
+    assert np.all((X >= bounds[:, 0] / 2) & (X <= bounds[:, 1] / 2))
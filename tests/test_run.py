@@ -0,0 +1,52 @@
+"""
+Tests for the surrogate-model wrappers of the Runner.
+"""
+
+import pytest
+import numpy as np
+
+from gpry.run import Runner
+from gpry.tools import is_in_bounds
+
+bounds = np.array([[-1, 1], [-1, 1]])
+
+
+def _gaussian_loglike(x, y):
+    return -0.5 * (x**2 + (y - 0.5) ** 2) / 0.2**2
+
+
+@pytest.fixture(scope="module")
+def runner():
+    runner = Runner(
+        _gaussian_loglike,
+        bounds=bounds,
+        options={"n_initial": 8, "max_initial": 16},
+        seed=0,
+        verbose=0,
+    )
+    runner.do_initial_training()
+    return runner
+
+
+_rng = np.random.default_rng(1)
+_inside = _rng.uniform(bounds[:, 0], bounds[:, 1], size=(5, 2))
+
+
+@pytest.mark.parametrize(
+    "X",
+    [
+        _inside,
+        np.concatenate([_inside, [[0.5, 1.5]], [[-2, 0]]]),  # -inf prior outside
+        _inside[0],  # single 1-D point
+        np.array([1.5, 0.5]),  # single 1-D point outside the prior
+    ],
+)
+def test_logL(runner, X):
+    logL = runner.logL(X)
+    expected = [
+        runner.gpr.predict(np.atleast_2d(x))[0] - runner.truth.logprior(x)
+        for x in np.atleast_2d(X)
+    ]
+    assert logL.shape == (len(expected),)
+    assert np.allclose(logL, expected)
+    assert np.array_equal(np.isinf(logL), ~is_in_bounds(X, bounds))
@@ -0,0 +1,66 @@
+"""
+Tests for the tools module.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+from scipy.spatial.distance import mahalanobis
+from scipy.stats import random_correlation
+
+from gpry.tools import check_candidates, gaussian_distance
+
+
+@pytest.mark.parametrize("dim", [1, 2, 5])
+def test_gaussian_distance(dim):
+    rng = np.random.default_rng(dim)
+    std = rng.uniform(0.1, 2, size=dim)
+    if dim > 1:
+        eigs = rng.uniform(size=dim)
+        corr = random_correlation.rvs(eigs / np.sum(eigs) * dim, random_state=rng)
+    else:
+        corr = np.eye(1)
+    covmat = np.outer(std, std) * corr
+    mean = rng.normal(size=dim)
+    points = rng.multivariate_normal(mean, covmat, size=50)
+    inv_covmat = np.linalg.inv(covmat)
+    expected = [mahalanobis(point, mean, inv_covmat) for point in points]
+    assert np.allclose(gaussian_distance(points, mean, covmat), expected)
+
+
+def _brute_force_candidates(X_train, new_X, decimals=8):
+    X_train_r = np.round(X_train, decimals)
+    new_X_r = np.round(new_X, decimals)
+    in_training_set = np.array(
+        [any(np.array_equal(x, xt) for xt in X_train_r) for x in new_X_r], dtype=bool
+    )
+    duplicates = np.array(
+        [any(np.array_equal(x, y) for y in new_X_r[:i]) for i, x in enumerate(new_X_r)],
+        dtype=bool,
+    )
+    return in_training_set, duplicates
+
+
+def test_check_candidates():
+    rng = np.random.default_rng(0)
+    dim = 3
+    X_train = rng.uniform(size=(20, dim))
+    new_X = rng.uniform(size=(15, dim))
+    new_X[1] = X_train[4]
+    new_X[2] = X_train[7] + 1e-12  # equal up to tolerance
+    new_X[3] = X_train[7] + 1e-3  # close, but different
+    new_X[5] = new_X[0]
+    new_X[6] = new_X[0]
+    new_X[8] = X_train[4]  # in training set and duplicated
+    # Shares coordinate values with a duplicated point, but is a different point
+    new_X[9] = new_X[0][::-1]
+    gpr = SimpleNamespace(preprocessing_X=None, X_train_=X_train)
+    in_training_set, duplicates = check_candidates(gpr, new_X)
+    expected_in_training_set, expected_duplicates = _brute_force_candidates(
+        X_train, new_X
+    )
+    assert np.array_equal(in_training_set, expected_in_training_set)
+    assert np.array_equal(duplicates, expected_duplicates)
+    assert np.flatnonzero(in_training_set).tolist() == [1, 2, 8]
+    assert np.flatnonzero(duplicates).tolist() == [5, 6, 8]